@@ -980,12 +980,26 @@ class Client(Methods):
         os.makedirs(directory, exist_ok=True) if not in_memory else None
         temp_file_path = os.path.abspath(re.sub("\\\\", "/", os.path.join(directory, file_name))) + ".temp"
         file = BytesIO() if in_memory else open(temp_file_path, "wb")
+        pending_write = None
 
         try:
             async for chunk in self.get_file(file_id, file_size, 0, 0, progress, progress_args):
-                file.write(chunk)
+                if in_memory:
+                    file.write(chunk)
+                else:
+                    # Write to disk off the event loop, so that each write overlaps with fetching the next chunk
+                    if pending_write is not None:
+                        await pending_write
+
+                    pending_write = self.loop.run_in_executor(None, file.write, chunk)
+
+            if pending_write is not None:
+                await pending_write
         except BaseException as e:
             if not in_memory:
+                if pending_write is not None:
+                    await asyncio.wait({pending_write})
+
                 file.close()
                 os.remove(temp_file_path)
 
@@ -17,12 +17,14 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from .invoke import Invoke
+from .pipeline import Pipeline
 from .resolve_peer import ResolvePeer
 from .save_file import SaveFile
 
 
 class Advanced(
     Invoke,
+    Pipeline,
     ResolvePeer,
     SaveFile
 ):
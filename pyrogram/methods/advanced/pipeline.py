@@ -0,0 +1,77 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import pyrogram
+from pyrogram.session.session import InvokeAfterChain, invoke_after_chain
+
+
+class Pipeline:
+    @asynccontextmanager
+    async def pipeline(self: "pyrogram.Client") -> AsyncIterator[None]:
+        """Chain the requests made inside this context, so Telegram executes them in the order they are transmitted.
+
+        Every request sent while the context is active is chained to the previous one using *invokeAfterMsg*, so
+        a burst of requests can be sent back-to-back without waiting for each response before sending the next one,
+        while Telegram still executes them one after the other.
+
+        The order is the order in which requests reach the network, not the order of the calls in your code:
+        tasks started inside the context (e.g.: with ``asyncio.gather``) take part in the same pipeline, but
+        ``gather`` doesn't define which of them transmits first.
+        File uploads go through a media session and are not chained: a method that uploads a file first
+        (e.g.: :meth:`~pyrogram.types.Message.reply_video` with a local path) transmits its message only once the
+        upload is done, usually after requests started later.
+
+        If a request fails, the ones already chained after it fail with ``MSG_WAIT_FAILED`` and requests sent from then
+        on are chained after the last one that succeeded. Retried requests are not chained.
+
+        Nested pipelines share the outermost one.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Example:
+            .. code-block:: python
+
+                # Both replies are sent without waiting for each other, Telegram executes them in the order
+                # they were transmitted
+                async with app.pipeline():
+                    await asyncio.gather(
+                        message.reply_text("Here is your sticker"),
+                        message.reply_sticker(sticker_file_id)
+                    )
+
+                # Reply and mark the incoming message as read without waiting in between (user accounts only).
+                # Whichever of the two is transmitted second fails too if the first one fails
+                async with app.pipeline():
+                    await asyncio.gather(
+                        message.reply_text("Got it"),
+                        message.read()
+                    )
+        """
+        if invoke_after_chain.get() is not None:
+            yield
+            return
+
+        token = invoke_after_chain.set(InvokeAfterChain())
+
+        try:
+            yield
+        finally:
+            invoke_after_chain.reset(token)
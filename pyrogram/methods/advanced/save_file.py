@@ -112,7 +112,9 @@ class SaveFile:
 
             part_size = 512 * 1024
 
-            if isinstance(path, (str, PurePath)):
+            is_path = isinstance(path, (str, PurePath))
+
+            if is_path:
                 fp = open(path, "rb")
             elif isinstance(path, io.IOBase):
                 fp = path
@@ -142,6 +144,7 @@ class SaveFile:
             is_missing_part = file_id is not None
             file_id = file_id or self.rnd_id()
             md5_sum = md5() if not is_big and not is_missing_part else None
+            is_progress_async = inspect.iscoroutinefunction(progress)
             dc_id = await self.storage.dc_id()
 
             session = self.media_sessions.get(dc_id)
@@ -159,7 +162,12 @@ class SaveFile:
                 fp.seek(part_size * file_part)
 
                 while True:
-                    chunk = fp.read(part_size)
+                    if is_path:
+                        # Read local files off the event loop, so that disk reads overlap with the parts being sent.
+                        # The default executor is used, the client one runs sync handlers and may be busy
+                        chunk = await self.loop.run_in_executor(None, fp.read, part_size)
+                    else:
+                        chunk = fp.read(part_size)
 
                     if not chunk:
                         if not is_big and not is_missing_part:
@@ -198,7 +206,7 @@ class SaveFile:
                             *progress_args
                         )
 
-                        if inspect.iscoroutinefunction(progress):
+                        if is_progress_async:
                             await func()
                         else:
                             await self.loop.run_in_executor(self.executor, func)
@@ -227,5 +235,5 @@ class SaveFile:
 
                 await asyncio.gather(*workers)
 
-                if isinstance(path, (str, PurePath)):
+                if is_path:
                     fp.close()
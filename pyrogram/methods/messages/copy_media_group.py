@@ -16,7 +16,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 from datetime import datetime
+from itertools import zip_longest
 from typing import Union, List, Optional
 
 import pyrogram
@@ -123,9 +125,30 @@ class CopyMediaGroup:
         quote_text, quote_entities = (await utils.parse_text_entities(self, quote_text, parse_mode, quote_entities)).values()
 
         media_group = await self.get_media_group(from_chat_id, message_id)
-        multi_media = []
+        # Expand captions and spoilers into one value per message up front, instead of checking their types each item
+        if isinstance(captions, str):
+            caption_list = [captions] + [""] * (len(media_group) - 1)
+        else:
+            caption_list = [
+                caption or (message.caption if message.caption and message.caption != "None" else "")
+                for message, caption in zip_longest(
+                    media_group,
+                    captions[:len(media_group)] if isinstance(captions, list) else []
+                )
+            ]
+
+        if isinstance(has_spoilers, list):
+            spoiler_list = has_spoilers[:len(media_group)] + [
+                message.has_media_spoiler for message in media_group[len(has_spoilers):]
+            ]
+        elif isinstance(has_spoilers, bool):
+            spoiler_list = [has_spoilers] * len(media_group)
+        else:
+            spoiler_list = [message.has_media_spoiler for message in media_group]
 
-        for i, message in enumerate(media_group):
+        media_list = []
+
+        for message, has_spoiler in zip(media_group, spoiler_list):
             if message.photo:
                 file_id = message.photo.file_id
             elif message.audio:
@@ -137,30 +160,19 @@ class CopyMediaGroup:
             else:
                 raise ValueError("Message with this type can't be copied.")
 
-            media = utils.get_input_media_from_file_id(
-                file_id=file_id,
-                has_spoiler=(
-                    has_spoilers[i]
-                    if isinstance(has_spoilers, list)
-                    and i < len(has_spoilers)
-                    else (
-                        has_spoilers
-                        if isinstance(has_spoilers, bool)
-                        else message.has_media_spoiler
-                    )
-                ),
-            )
-            multi_media.append(
-                raw.types.InputSingleMedia(
-                    media=media,
-                    random_id=self.rnd_id(),
-                    **await self.parser.parse(
-                        captions[i] if isinstance(captions, list) and i < len(captions) and captions[i] else
-                        captions if isinstance(captions, str) and i == 0 else
-                        message.caption if message.caption and message.caption != "None" and not type(
-                            captions) is str else "")
-                )
+            media_list.append(utils.get_input_media_from_file_id(file_id=file_id, has_spoiler=has_spoiler))
+
+        # Captions are parsed concurrently, mentions in them may need to resolve peers
+        parsed_captions = await asyncio.gather(*[self.parser.parse(caption) for caption in caption_list])
+
+        multi_media = [
+            raw.types.InputSingleMedia(
+                media=media,
+                random_id=self.rnd_id(),
+                **parsed_caption
             )
+            for media, parsed_caption in zip(media_list, parsed_captions)
+        ]
 
         r = await self.invoke(
             raw.functions.messages.SendMultiMedia(
@@ -0,0 +1,45 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .config_simple import ConfigSimple
+from .app_update import AppUpdate
+from .invite_text import InviteText
+from .support import Support
+from .terms_of_service import TermsOfService
+from .recent_me_urls import RecentMeUrls
+from .terms_of_service_update import TermsOfServiceUpdate
+from .deep_link_info import DeepLinkInfo
+from .passport_config import PassportConfig
+from .support_name import SupportName
+from .user_info import UserInfo
+from .promo_data import PromoData
+from .country_code import CountryCode
+from .country import Country
+from .countries_list import CountriesList
+from .premium_promo import PremiumPromo
+from .app_config import AppConfig
+from .peer_color_set import PeerColorSet
+from .peer_color_option import PeerColorOption
+from .peer_colors import PeerColors
+from .timezones_list import TimezonesList
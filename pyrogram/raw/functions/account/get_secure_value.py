@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetSecureValue(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``73665BC2``
+
+    Parameters:
+        types (List of :obj:`SecureValueType <pyrogram.raw.base.SecureValueType>`):
+            N/A
+
+    Returns:
+        List of :obj:`SecureValue <pyrogram.raw.base.SecureValue>`
+    """
+
+    __slots__: List[str] = ["types"]
+
+    ID = 0x73665bc2
+    QUALNAME = "functions.account.GetSecureValue"
+
+    def __init__(self, *, types: List["raw.base.SecureValueType"]) -> None:
+        self.types = types  # Vector<SecureValueType>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetSecureValue":
+        # No flags
+        
+        types = TLObject.read(b)
+        
+        return GetSecureValue(types=types)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.types))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ToggleConnectedBotPaused(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``646E1097``
+
+    Parameters:
+        peer (:obj:`InputPeer <pyrogram.raw.base.InputPeer>`):
+            N/A
+
+        paused (``bool``):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["peer", "paused"]
+
+    ID = 0x646e1097
+    QUALNAME = "functions.account.ToggleConnectedBotPaused"
+
+    def __init__(self, *, peer: "raw.base.InputPeer", paused: bool) -> None:
+        self.peer = peer  # InputPeer
+        self.paused = paused  # Bool
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ToggleConnectedBotPaused":
+        # No flags
+        
+        peer = TLObject.read(b)
+        
+        paused = Bool.read(b)
+        
+        return ToggleConnectedBotPaused(peer=peer, paused=paused)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.peer.write())
+        
+        b.write(Bool(self.paused))
+        
+        return b.getvalue()
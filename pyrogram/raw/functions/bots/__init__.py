@@ -0,0 +1,54 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .send_custom_request import SendCustomRequest
+from .answer_webhook_json_query import AnswerWebhookJSONQuery
+from .set_bot_commands import SetBotCommands
+from .reset_bot_commands import ResetBotCommands
+from .get_bot_commands import GetBotCommands
+from .set_bot_menu_button import SetBotMenuButton
+from .get_bot_menu_button import GetBotMenuButton
+from .set_bot_broadcast_default_admin_rights import SetBotBroadcastDefaultAdminRights
+from .set_bot_group_default_admin_rights import SetBotGroupDefaultAdminRights
+from .set_bot_info import SetBotInfo
+from .get_bot_info import GetBotInfo
+from .reorder_usernames import ReorderUsernames
+from .toggle_username import ToggleUsername
+from .can_send_message import CanSendMessage
+from .allow_send_message import AllowSendMessage
+from .invoke_web_view_custom_method import InvokeWebViewCustomMethod
+from .get_popular_app_bots import GetPopularAppBots
+from .add_preview_media import AddPreviewMedia
+from .edit_preview_media import EditPreviewMedia
+from .delete_preview_media import DeletePreviewMedia
+from .reorder_preview_medias import ReorderPreviewMedias
+from .get_preview_info import GetPreviewInfo
+from .get_preview_medias import GetPreviewMedias
+from .update_user_emoji_status import UpdateUserEmojiStatus
+from .toggle_user_emoji_status_permission import ToggleUserEmojiStatusPermission
+from .check_download_file_params import CheckDownloadFileParams
+from .get_admined_bots import GetAdminedBots
+from .update_star_ref_program import UpdateStarRefProgram
+from .set_custom_verification import SetCustomVerification
+from .get_bot_recommendations import GetBotRecommendations
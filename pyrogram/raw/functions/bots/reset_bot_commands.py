@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ResetBotCommands(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``3D8DE0F9``
+
+    Parameters:
+        scope (:obj:`BotCommandScope <pyrogram.raw.base.BotCommandScope>`):
+            N/A
+
+        lang_code (``str``):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["scope", "lang_code"]
+
+    ID = 0x3d8de0f9
+    QUALNAME = "functions.bots.ResetBotCommands"
+
+    def __init__(self, *, scope: "raw.base.BotCommandScope", lang_code: str) -> None:
+        self.scope = scope  # BotCommandScope
+        self.lang_code = lang_code  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ResetBotCommands":
+        # No flags
+        
+        scope = TLObject.read(b)
+        
+        lang_code = String.read(b)
+        
+        return ResetBotCommands(scope=scope, lang_code=lang_code)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.scope.write())
+        
+        b.write(String(self.lang_code))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SetBotMenuButton(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``4504D54F``
+
+    Parameters:
+        user_id (:obj:`InputUser <pyrogram.raw.base.InputUser>`):
+            N/A
+
+        button (:obj:`BotMenuButton <pyrogram.raw.base.BotMenuButton>`):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["user_id", "button"]
+
+    ID = 0x4504d54f
+    QUALNAME = "functions.bots.SetBotMenuButton"
+
+    def __init__(self, *, user_id: "raw.base.InputUser", button: "raw.base.BotMenuButton") -> None:
+        self.user_id = user_id  # InputUser
+        self.button = button  # BotMenuButton
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SetBotMenuButton":
+        # No flags
+        
+        user_id = TLObject.read(b)
+        
+        button = TLObject.read(b)
+        
+        return SetBotMenuButton(user_id=user_id, button=button)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.user_id.write())
+        
+        b.write(self.button.write())
+        
+        return b.getvalue()
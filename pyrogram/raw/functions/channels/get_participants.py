@@ -0,0 +1,104 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetParticipants(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``77CED9D0``
+
+    Parameters:
+        channel (:obj:`InputChannel <pyrogram.raw.base.InputChannel>`):
+            N/A
+
+        filter (:obj:`ChannelParticipantsFilter <pyrogram.raw.base.ChannelParticipantsFilter>`):
+            N/A
+
+        offset (``int`` ``32-bit``):
+            N/A
+
+        limit (``int`` ``32-bit``):
+            N/A
+
+        hash (``int`` ``64-bit``):
+            N/A
+
+    Returns:
+        :obj:`channels.ChannelParticipants <pyrogram.raw.base.channels.ChannelParticipants>`
+    """
+
+    __slots__: List[str] = ["channel", "filter", "offset", "limit", "hash"]
+
+    ID = 0x77ced9d0
+    QUALNAME = "functions.channels.GetParticipants"
+
+    def __init__(self, *, channel: "raw.base.InputChannel", filter: "raw.base.ChannelParticipantsFilter", offset: int, limit: int, hash: int) -> None:
+        self.channel = channel  # InputChannel
+        self.filter = filter  # ChannelParticipantsFilter
+        self.offset = offset  # int
+        self.limit = limit  # int
+        self.hash = hash  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetParticipants":
+        # No flags
+        
+        channel = TLObject.read(b)
+        
+        filter = TLObject.read(b)
+        
+        offset = Int.read(b)
+        
+        limit = Int.read(b)
+        
+        hash = Long.read(b)
+        
+        return GetParticipants(channel=channel, filter=filter, offset=offset, limit=limit, hash=hash)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.channel.write())
+        
+        b.write(self.filter.write())
+        
+        b.write(Int(self.offset))
+        
+        b.write(Int(self.limit))
+        
+        b.write(Long(self.hash))
+        
+        return b.getvalue()
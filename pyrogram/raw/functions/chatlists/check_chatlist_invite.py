@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CheckChatlistInvite(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``41C10FFF``
+
+    Parameters:
+        slug (``str``):
+            N/A
+
+    Returns:
+        :obj:`chatlists.ChatlistInvite <pyrogram.raw.base.chatlists.ChatlistInvite>`
+    """
+
+    __slots__: List[str] = ["slug"]
+
+    ID = 0x41c10fff
+    QUALNAME = "functions.chatlists.CheckChatlistInvite"
+
+    def __init__(self, *, slug: str) -> None:
+        self.slug = slug  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CheckChatlistInvite":
+        # No flags
+        
+        slug = String.read(b)
+        
+        return CheckChatlistInvite(slug=slug)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.slug))
+        
+        return b.getvalue()
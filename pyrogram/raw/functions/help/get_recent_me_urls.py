@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetRecentMeUrls(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``3DC0F114``
+
+    Parameters:
+        referer (``str``):
+            N/A
+
+    Returns:
+        :obj:`help.RecentMeUrls <pyrogram.raw.base.help.RecentMeUrls>`
+    """
+
+    __slots__: List[str] = ["referer"]
+
+    ID = 0x3dc0f114
+    QUALNAME = "functions.help.GetRecentMeUrls"
+
+    def __init__(self, *, referer: str) -> None:
+        self.referer = referer  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetRecentMeUrls":
+        # No flags
+        
+        referer = String.read(b)
+        
+        return GetRecentMeUrls(referer=referer)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.referer))
+        
+        return b.getvalue()
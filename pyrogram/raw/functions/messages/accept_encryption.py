@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AcceptEncryption(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``3DBC0415``
+
+    Parameters:
+        peer (:obj:`InputEncryptedChat <pyrogram.raw.base.InputEncryptedChat>`):
+            N/A
+
+        g_b (``bytes``):
+            N/A
+
+        key_fingerprint (``int`` ``64-bit``):
+            N/A
+
+    Returns:
+        :obj:`EncryptedChat <pyrogram.raw.base.EncryptedChat>`
+    """
+
+    __slots__: List[str] = ["peer", "g_b", "key_fingerprint"]
+
+    ID = 0x3dbc0415
+    QUALNAME = "functions.messages.AcceptEncryption"
+
+    def __init__(self, *, peer: "raw.base.InputEncryptedChat", g_b: bytes, key_fingerprint: int) -> None:
+        self.peer = peer  # InputEncryptedChat
+        self.g_b = g_b  # bytes
+        self.key_fingerprint = key_fingerprint  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "AcceptEncryption":
+        # No flags
+        
+        peer = TLObject.read(b)
+        
+        g_b = Bytes.read(b)
+        
+        key_fingerprint = Long.read(b)
+        
+        return AcceptEncryption(peer=peer, g_b=g_b, key_fingerprint=key_fingerprint)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.peer.write())
+        
+        b.write(Bytes(self.g_b))
+        
+        b.write(Long(self.key_fingerprint))
+        
+        return b.getvalue()
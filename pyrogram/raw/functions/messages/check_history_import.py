@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CheckHistoryImport(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``43FE19F3``
+
+    Parameters:
+        import_head (``str``):
+            N/A
+
+    Returns:
+        :obj:`messages.HistoryImportParsed <pyrogram.raw.base.messages.HistoryImportParsed>`
+    """
+
+    __slots__: List[str] = ["import_head"]
+
+    ID = 0x43fe19f3
+    QUALNAME = "functions.messages.CheckHistoryImport"
+
+    def __init__(self, *, import_head: str) -> None:
+        self.import_head = import_head  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CheckHistoryImport":
+        # No flags
+        
+        import_head = String.read(b)
+        
+        return CheckHistoryImport(import_head=import_head)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.import_head))
+        
+        return b.getvalue()
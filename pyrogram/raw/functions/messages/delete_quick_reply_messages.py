@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class DeleteQuickReplyMessages(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``E105E910``
+
+    Parameters:
+        shortcut_id (``int`` ``32-bit``):
+            N/A
+
+        id (List of ``int`` ``32-bit``):
+            N/A
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["shortcut_id", "id"]
+
+    ID = 0xe105e910
+    QUALNAME = "functions.messages.DeleteQuickReplyMessages"
+
+    def __init__(self, *, shortcut_id: int, id: List[int]) -> None:
+        self.shortcut_id = shortcut_id  # int
+        self.id = id  # Vector<int>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "DeleteQuickReplyMessages":
+        # No flags
+        
+        shortcut_id = Int.read(b)
+        
+        id = TLObject.read(b, Int)
+        
+        return DeleteQuickReplyMessages(shortcut_id=shortcut_id, id=id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.shortcut_id))
+        
+        b.write(Vector(self.id, Int))
+        
+        return b.getvalue()
@@ -0,0 +1,100 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class DeleteSavedHistory(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``6E98102B``
+
+    Parameters:
+        peer (:obj:`InputPeer <pyrogram.raw.base.InputPeer>`):
+            N/A
+
+        max_id (``int`` ``32-bit``):
+            N/A
+
+        min_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+        max_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`messages.AffectedHistory <pyrogram.raw.base.messages.AffectedHistory>`
+    """
+
+    __slots__: List[str] = ["peer", "max_id", "min_date", "max_date"]
+
+    ID = 0x6e98102b
+    QUALNAME = "functions.messages.DeleteSavedHistory"
+
+    def __init__(self, *, peer: "raw.base.InputPeer", max_id: int, min_date: Optional[int] = None, max_date: Optional[int] = None) -> None:
+        self.peer = peer  # InputPeer
+        self.max_id = max_id  # int
+        self.min_date = min_date  # flags.2?int
+        self.max_date = max_date  # flags.3?int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "DeleteSavedHistory":
+        
+        flags = Int.read(b)
+        
+        peer = TLObject.read(b)
+        
+        max_id = Int.read(b)
+        
+        min_date = Int.read(b) if flags & (1 << 2) else None
+        max_date = Int.read(b) if flags & (1 << 3) else None
+        return DeleteSavedHistory(peer=peer, max_id=max_id, min_date=min_date, max_date=max_date)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 2) if self.min_date is not None else 0
+        flags |= (1 << 3) if self.max_date is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.peer.write())
+        
+        b.write(Int(self.max_id))
+        
+        if self.min_date is not None:
+            b.write(Int(self.min_date))
+        
+        if self.max_date is not None:
+            b.write(Int(self.max_date))
+        
+        return b.getvalue()
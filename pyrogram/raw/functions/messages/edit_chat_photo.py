@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EditChatPhoto(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``35DDD674``
+
+    Parameters:
+        chat_id (``int`` ``64-bit``):
+            N/A
+
+        photo (:obj:`InputChatPhoto <pyrogram.raw.base.InputChatPhoto>`):
+            N/A
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["chat_id", "photo"]
+
+    ID = 0x35ddd674
+    QUALNAME = "functions.messages.EditChatPhoto"
+
+    def __init__(self, *, chat_id: int, photo: "raw.base.InputChatPhoto") -> None:
+        self.chat_id = chat_id  # long
+        self.photo = photo  # InputChatPhoto
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EditChatPhoto":
+        # No flags
+        
+        chat_id = Long.read(b)
+        
+        photo = TLObject.read(b)
+        
+        return EditChatPhoto(chat_id=chat_id, photo=photo)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.chat_id))
+        
+        b.write(self.photo.write())
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EditQuickReplyShortcut(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``5C003CEF``
+
+    Parameters:
+        shortcut_id (``int`` ``32-bit``):
+            N/A
+
+        shortcut (``str``):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["shortcut_id", "shortcut"]
+
+    ID = 0x5c003cef
+    QUALNAME = "functions.messages.EditQuickReplyShortcut"
+
+    def __init__(self, *, shortcut_id: int, shortcut: str) -> None:
+        self.shortcut_id = shortcut_id  # int
+        self.shortcut = shortcut  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EditQuickReplyShortcut":
+        # No flags
+        
+        shortcut_id = Int.read(b)
+        
+        shortcut = String.read(b)
+        
+        return EditQuickReplyShortcut(shortcut_id=shortcut_id, shortcut=shortcut)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.shortcut_id))
+        
+        b.write(String(self.shortcut))
+        
+        return b.getvalue()
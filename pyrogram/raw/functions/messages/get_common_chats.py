@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetCommonChats(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``E40CA104``
+
+    Parameters:
+        user_id (:obj:`InputUser <pyrogram.raw.base.InputUser>`):
+            N/A
+
+        max_id (``int`` ``64-bit``):
+            N/A
+
+        limit (``int`` ``32-bit``):
+            N/A
+
+    Returns:
+        :obj:`messages.Chats <pyrogram.raw.base.messages.Chats>`
+    """
+
+    __slots__: List[str] = ["user_id", "max_id", "limit"]
+
+    ID = 0xe40ca104
+    QUALNAME = "functions.messages.GetCommonChats"
+
+    def __init__(self, *, user_id: "raw.base.InputUser", max_id: int, limit: int) -> None:
+        self.user_id = user_id  # InputUser
+        self.max_id = max_id  # long
+        self.limit = limit  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetCommonChats":
+        # No flags
+        
+        user_id = TLObject.read(b)
+        
+        max_id = Long.read(b)
+        
+        limit = Int.read(b)
+        
+        return GetCommonChats(user_id=user_id, max_id=max_id, limit=limit)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.user_id.write())
+        
+        b.write(Long(self.max_id))
+        
+        b.write(Int(self.limit))
+        
+        return b.getvalue()
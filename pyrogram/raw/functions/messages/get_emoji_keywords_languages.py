@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetEmojiKeywordsLanguages(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``4E9963B2``
+
+    Parameters:
+        lang_codes (List of ``str``):
+            N/A
+
+    Returns:
+        List of :obj:`EmojiLanguage <pyrogram.raw.base.EmojiLanguage>`
+    """
+
+    __slots__: List[str] = ["lang_codes"]
+
+    ID = 0x4e9963b2
+    QUALNAME = "functions.messages.GetEmojiKeywordsLanguages"
+
+    def __init__(self, *, lang_codes: List[str]) -> None:
+        self.lang_codes = lang_codes  # Vector<string>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetEmojiKeywordsLanguages":
+        # No flags
+        
+        lang_codes = TLObject.read(b, String)
+        
+        return GetEmojiKeywordsLanguages(lang_codes=lang_codes)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.lang_codes, String))
+        
+        return b.getvalue()
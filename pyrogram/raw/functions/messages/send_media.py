@@ -0,0 +1,208 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SendMedia(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``7852834E``
+
+    Parameters:
+        peer (:obj:`InputPeer <pyrogram.raw.base.InputPeer>`):
+            N/A
+
+        media (:obj:`InputMedia <pyrogram.raw.base.InputMedia>`):
+            N/A
+
+        message (``str``):
+            N/A
+
+        random_id (``int`` ``64-bit``):
+            N/A
+
+        silent (``bool``, *optional*):
+            N/A
+
+        background (``bool``, *optional*):
+            N/A
+
+        clear_draft (``bool``, *optional*):
+            N/A
+
+        noforwards (``bool``, *optional*):
+            N/A
+
+        update_stickersets_order (``bool``, *optional*):
+            N/A
+
+        invert_media (``bool``, *optional*):
+            N/A
+
+        allow_paid_floodskip (``bool``, *optional*):
+            N/A
+
+        reply_to (:obj:`InputReplyTo <pyrogram.raw.base.InputReplyTo>`, *optional*):
+            N/A
+
+        reply_markup (:obj:`ReplyMarkup <pyrogram.raw.base.ReplyMarkup>`, *optional*):
+            N/A
+
+        entities (List of :obj:`MessageEntity <pyrogram.raw.base.MessageEntity>`, *optional*):
+            N/A
+
+        schedule_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+        send_as (:obj:`InputPeer <pyrogram.raw.base.InputPeer>`, *optional*):
+            N/A
+
+        quick_reply_shortcut (:obj:`InputQuickReplyShortcut <pyrogram.raw.base.InputQuickReplyShortcut>`, *optional*):
+            N/A
+
+        effect (``int`` ``64-bit``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["peer", "media", "message", "random_id", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "allow_paid_floodskip", "reply_to", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", "effect"]
+
+    ID = 0x7852834e
+    QUALNAME = "functions.messages.SendMedia"
+
+    def __init__(self, *, peer: "raw.base.InputPeer", media: "raw.base.InputMedia", message: str, random_id: int, silent: Optional[bool] = None, background: Optional[bool] = None, clear_draft: Optional[bool] = None, noforwards: Optional[bool] = None, update_stickersets_order: Optional[bool] = None, invert_media: Optional[bool] = None, allow_paid_floodskip: Optional[bool] = None, reply_to: "raw.base.InputReplyTo" = None, reply_markup: "raw.base.ReplyMarkup" = None, entities: Optional[List["raw.base.MessageEntity"]] = None, schedule_date: Optional[int] = None, send_as: "raw.base.InputPeer" = None, quick_reply_shortcut: "raw.base.InputQuickReplyShortcut" = None, effect: Optional[int] = None) -> None:
+        self.peer = peer  # InputPeer
+        self.media = media  # InputMedia
+        self.message = message  # string
+        self.random_id = random_id  # long
+        self.silent = silent  # flags.5?true
+        self.background = background  # flags.6?true
+        self.clear_draft = clear_draft  # flags.7?true
+        self.noforwards = noforwards  # flags.14?true
+        self.update_stickersets_order = update_stickersets_order  # flags.15?true
+        self.invert_media = invert_media  # flags.16?true
+        self.allow_paid_floodskip = allow_paid_floodskip  # flags.19?true
+        self.reply_to = reply_to  # flags.0?InputReplyTo
+        self.reply_markup = reply_markup  # flags.2?ReplyMarkup
+        self.entities = entities  # flags.3?Vector<MessageEntity>
+        self.schedule_date = schedule_date  # flags.10?int
+        self.send_as = send_as  # flags.13?InputPeer
+        self.quick_reply_shortcut = quick_reply_shortcut  # flags.17?InputQuickReplyShortcut
+        self.effect = effect  # flags.18?long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SendMedia":
+        
+        flags = Int.read(b)
+        
+        silent = True if flags & (1 << 5) else False
+        background = True if flags & (1 << 6) else False
+        clear_draft = True if flags & (1 << 7) else False
+        noforwards = True if flags & (1 << 14) else False
+        update_stickersets_order = True if flags & (1 << 15) else False
+        invert_media = True if flags & (1 << 16) else False
+        allow_paid_floodskip = True if flags & (1 << 19) else False
+        peer = TLObject.read(b)
+        
+        reply_to = TLObject.read(b) if flags & (1 << 0) else None
+        
+        media = TLObject.read(b)
+        
+        message = String.read(b)
+        
+        random_id = Long.read(b)
+        
+        reply_markup = TLObject.read(b) if flags & (1 << 2) else None
+        
+        entities = TLObject.read(b) if flags & (1 << 3) else []
+        
+        schedule_date = Int.read(b) if flags & (1 << 10) else None
+        send_as = TLObject.read(b) if flags & (1 << 13) else None
+        
+        quick_reply_shortcut = TLObject.read(b) if flags & (1 << 17) else None
+        
+        effect = Long.read(b) if flags & (1 << 18) else None
+        return SendMedia(peer=peer, media=media, message=message, random_id=random_id, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, reply_to=reply_to, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 5) if self.silent else 0
+        flags |= (1 << 6) if self.background else 0
+        flags |= (1 << 7) if self.clear_draft else 0
+        flags |= (1 << 14) if self.noforwards else 0
+        flags |= (1 << 15) if self.update_stickersets_order else 0
+        flags |= (1 << 16) if self.invert_media else 0
+        flags |= (1 << 19) if self.allow_paid_floodskip else 0
+        flags |= (1 << 0) if self.reply_to is not None else 0
+        flags |= (1 << 2) if self.reply_markup is not None else 0
+        flags |= (1 << 3) if self.entities else 0
+        flags |= (1 << 10) if self.schedule_date is not None else 0
+        flags |= (1 << 13) if self.send_as is not None else 0
+        flags |= (1 << 17) if self.quick_reply_shortcut is not None else 0
+        flags |= (1 << 18) if self.effect is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.peer.write())
+        
+        if self.reply_to is not None:
+            b.write(self.reply_to.write())
+        
+        b.write(self.media.write())
+        
+        b.write(String(self.message))
+        
+        b.write(Long(self.random_id))
+        
+        if self.reply_markup is not None:
+            b.write(self.reply_markup.write())
+        
+        if self.entities is not None:
+            b.write(Vector(self.entities))
+        
+        if self.schedule_date is not None:
+            b.write(Int(self.schedule_date))
+        
+        if self.send_as is not None:
+            b.write(self.send_as.write())
+        
+        if self.quick_reply_shortcut is not None:
+            b.write(self.quick_reply_shortcut.write())
+        
+        if self.effect is not None:
+            b.write(Long(self.effect))
+        
+        return b.getvalue()
@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SendWebViewData(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``DC0242C8``
+
+    Parameters:
+        bot (:obj:`InputUser <pyrogram.raw.base.InputUser>`):
+            N/A
+
+        random_id (``int`` ``64-bit``):
+            N/A
+
+        button_text (``str``):
+            N/A
+
+        data (``str``):
+            N/A
+
+    Returns:
+        :obj:`Updates <pyrogram.raw.base.Updates>`
+    """
+
+    __slots__: List[str] = ["bot", "random_id", "button_text", "data"]
+
+    ID = 0xdc0242c8
+    QUALNAME = "functions.messages.SendWebViewData"
+
+    def __init__(self, *, bot: "raw.base.InputUser", random_id: int, button_text: str, data: str) -> None:
+        self.bot = bot  # InputUser
+        self.random_id = random_id  # long
+        self.button_text = button_text  # string
+        self.data = data  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SendWebViewData":
+        # No flags
+        
+        bot = TLObject.read(b)
+        
+        random_id = Long.read(b)
+        
+        button_text = String.read(b)
+        
+        data = String.read(b)
+        
+        return SendWebViewData(bot=bot, random_id=random_id, button_text=button_text, data=data)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.bot.write())
+        
+        b.write(Long(self.random_id))
+        
+        b.write(String(self.button_text))
+        
+        b.write(String(self.data))
+        
+        return b.getvalue()
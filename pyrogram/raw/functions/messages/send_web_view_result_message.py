@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SendWebViewResultMessage(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``A4314F5``
+
+    Parameters:
+        bot_query_id (``str``):
+            N/A
+
+        result (:obj:`InputBotInlineResult <pyrogram.raw.base.InputBotInlineResult>`):
+            N/A
+
+    Returns:
+        :obj:`WebViewMessageSent <pyrogram.raw.base.WebViewMessageSent>`
+    """
+
+    __slots__: List[str] = ["bot_query_id", "result"]
+
+    ID = 0xa4314f5
+    QUALNAME = "functions.messages.SendWebViewResultMessage"
+
+    def __init__(self, *, bot_query_id: str, result: "raw.base.InputBotInlineResult") -> None:
+        self.bot_query_id = bot_query_id  # string
+        self.result = result  # InputBotInlineResult
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SendWebViewResultMessage":
+        # No flags
+        
+        bot_query_id = String.read(b)
+        
+        result = TLObject.read(b)
+        
+        return SendWebViewResultMessage(bot_query_id=bot_query_id, result=result)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.bot_query_id))
+        
+        b.write(self.result.write())
+        
+        return b.getvalue()
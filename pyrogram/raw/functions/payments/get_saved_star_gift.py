@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetSavedStarGift(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``B455A106``
+
+    Parameters:
+        stargift (List of :obj:`InputSavedStarGift <pyrogram.raw.base.InputSavedStarGift>`):
+            N/A
+
+    Returns:
+        :obj:`payments.SavedStarGifts <pyrogram.raw.base.payments.SavedStarGifts>`
+    """
+
+    __slots__: List[str] = ["stargift"]
+
+    ID = 0xb455a106
+    QUALNAME = "functions.payments.GetSavedStarGift"
+
+    def __init__(self, *, stargift: List["raw.base.InputSavedStarGift"]) -> None:
+        self.stargift = stargift  # Vector<InputSavedStarGift>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetSavedStarGift":
+        # No flags
+        
+        stargift = TLObject.read(b)
+        
+        return GetSavedStarGift(stargift=stargift)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.stargift))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class CheckGroupCall(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``B59CF977``
+
+    Parameters:
+        call (:obj:`InputGroupCall <pyrogram.raw.base.InputGroupCall>`):
+            N/A
+
+        sources (List of ``int`` ``32-bit``):
+            N/A
+
+    Returns:
+        List of ``int`` ``32-bit``
+    """
+
+    __slots__: List[str] = ["call", "sources"]
+
+    ID = 0xb59cf977
+    QUALNAME = "functions.phone.CheckGroupCall"
+
+    def __init__(self, *, call: "raw.base.InputGroupCall", sources: List[int]) -> None:
+        self.call = call  # InputGroupCall
+        self.sources = sources  # Vector<int>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "CheckGroupCall":
+        # No flags
+        
+        call = TLObject.read(b)
+        
+        sources = TLObject.read(b, Int)
+        
+        return CheckGroupCall(call=call, sources=sources)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.call.write())
+        
+        b.write(Vector(self.sources, Int))
+        
+        return b.getvalue()
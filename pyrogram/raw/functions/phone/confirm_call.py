@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ConfirmCall(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``2EFE1722``
+
+    Parameters:
+        peer (:obj:`InputPhoneCall <pyrogram.raw.base.InputPhoneCall>`):
+            N/A
+
+        g_a (``bytes``):
+            N/A
+
+        key_fingerprint (``int`` ``64-bit``):
+            N/A
+
+        protocol (:obj:`PhoneCallProtocol <pyrogram.raw.base.PhoneCallProtocol>`):
+            N/A
+
+    Returns:
+        :obj:`phone.PhoneCall <pyrogram.raw.base.phone.PhoneCall>`
+    """
+
+    __slots__: List[str] = ["peer", "g_a", "key_fingerprint", "protocol"]
+
+    ID = 0x2efe1722
+    QUALNAME = "functions.phone.ConfirmCall"
+
+    def __init__(self, *, peer: "raw.base.InputPhoneCall", g_a: bytes, key_fingerprint: int, protocol: "raw.base.PhoneCallProtocol") -> None:
+        self.peer = peer  # InputPhoneCall
+        self.g_a = g_a  # bytes
+        self.key_fingerprint = key_fingerprint  # long
+        self.protocol = protocol  # PhoneCallProtocol
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ConfirmCall":
+        # No flags
+        
+        peer = TLObject.read(b)
+        
+        g_a = Bytes.read(b)
+        
+        key_fingerprint = Long.read(b)
+        
+        protocol = TLObject.read(b)
+        
+        return ConfirmCall(peer=peer, g_a=g_a, key_fingerprint=key_fingerprint, protocol=protocol)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.peer.write())
+        
+        b.write(Bytes(self.g_a))
+        
+        b.write(Long(self.key_fingerprint))
+        
+        b.write(self.protocol.write())
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ReplaceSticker(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``4696459A``
+
+    Parameters:
+        sticker (:obj:`InputDocument <pyrogram.raw.base.InputDocument>`):
+            N/A
+
+        new_sticker (:obj:`InputStickerSetItem <pyrogram.raw.base.InputStickerSetItem>`):
+            N/A
+
+    Returns:
+        :obj:`messages.StickerSet <pyrogram.raw.base.messages.StickerSet>`
+    """
+
+    __slots__: List[str] = ["sticker", "new_sticker"]
+
+    ID = 0x4696459a
+    QUALNAME = "functions.stickers.ReplaceSticker"
+
+    def __init__(self, *, sticker: "raw.base.InputDocument", new_sticker: "raw.base.InputStickerSetItem") -> None:
+        self.sticker = sticker  # InputDocument
+        self.new_sticker = new_sticker  # InputStickerSetItem
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ReplaceSticker":
+        # No flags
+        
+        sticker = TLObject.read(b)
+        
+        new_sticker = TLObject.read(b)
+        
+        return ReplaceSticker(sticker=sticker, new_sticker=new_sticker)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.sticker.write())
+        
+        b.write(self.new_sticker.write())
+        
+        return b.getvalue()
@@ -0,0 +1,55 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .privacy_rules import PrivacyRules
+from .authorizations import Authorizations
+from .password import Password
+from .password_settings import PasswordSettings
+from .password_input_settings import PasswordInputSettings
+from .tmp_password import TmpPassword
+from .web_authorizations import WebAuthorizations
+from .authorization_form import AuthorizationForm
+from .sent_email_code import SentEmailCode
+from .takeout import Takeout
+from .wall_papers_not_modified import WallPapersNotModified
+from .wall_papers import WallPapers
+from .auto_download_settings import AutoDownloadSettings
+from .themes_not_modified import ThemesNotModified
+from .themes import Themes
+from .content_settings import ContentSettings
+from .reset_password_failed_wait import ResetPasswordFailedWait
+from .reset_password_requested_wait import ResetPasswordRequestedWait
+from .reset_password_ok import ResetPasswordOk
+from .saved_ringtones_not_modified import SavedRingtonesNotModified
+from .saved_ringtones import SavedRingtones
+from .saved_ringtone import SavedRingtone
+from .saved_ringtone_converted import SavedRingtoneConverted
+from .emoji_statuses_not_modified import EmojiStatusesNotModified
+from .emoji_statuses import EmojiStatuses
+from .email_verified import EmailVerified
+from .email_verified_login import EmailVerifiedLogin
+from .auto_save_settings import AutoSaveSettings
+from .connected_bots import ConnectedBots
+from .business_chat_links import BusinessChatLinks
+from .resolved_business_chat_links import ResolvedBusinessChatLinks
@@ -0,0 +1,97 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AutoDownloadSettings(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.account.AutoDownloadSettings`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``63CACF26``
+
+    Parameters:
+        low (:obj:`AutoDownloadSettings <pyrogram.raw.base.AutoDownloadSettings>`):
+            N/A
+
+        medium (:obj:`AutoDownloadSettings <pyrogram.raw.base.AutoDownloadSettings>`):
+            N/A
+
+        high (:obj:`AutoDownloadSettings <pyrogram.raw.base.AutoDownloadSettings>`):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.GetAutoDownloadSettings
+    """
+
+    __slots__: List[str] = ["low", "medium", "high"]
+
+    ID = 0x63cacf26
+    QUALNAME = "types.account.AutoDownloadSettings"
+
+    def __init__(self, *, low: "raw.base.AutoDownloadSettings", medium: "raw.base.AutoDownloadSettings", high: "raw.base.AutoDownloadSettings") -> None:
+        self.low = low  # AutoDownloadSettings
+        self.medium = medium  # AutoDownloadSettings
+        self.high = high  # AutoDownloadSettings
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "AutoDownloadSettings":
+        # No flags
+        
+        low = TLObject.read(b)
+        
+        medium = TLObject.read(b)
+        
+        high = TLObject.read(b)
+        
+        return AutoDownloadSettings(low=low, medium=medium, high=high)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.low.write())
+        
+        b.write(self.medium.write())
+        
+        b.write(self.high.write())
+        
+        return b.getvalue()
@@ -0,0 +1,97 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class BusinessChatLinks(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.account.BusinessChatLinks`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``EC43A2D1``
+
+    Parameters:
+        links (List of :obj:`BusinessChatLink <pyrogram.raw.base.BusinessChatLink>`):
+            N/A
+
+        chats (List of :obj:`Chat <pyrogram.raw.base.Chat>`):
+            N/A
+
+        users (List of :obj:`User <pyrogram.raw.base.User>`):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.GetBusinessChatLinks
+    """
+
+    __slots__: List[str] = ["links", "chats", "users"]
+
+    ID = 0xec43a2d1
+    QUALNAME = "types.account.BusinessChatLinks"
+
+    def __init__(self, *, links: List["raw.base.BusinessChatLink"], chats: List["raw.base.Chat"], users: List["raw.base.User"]) -> None:
+        self.links = links  # Vector<BusinessChatLink>
+        self.chats = chats  # Vector<Chat>
+        self.users = users  # Vector<User>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "BusinessChatLinks":
+        # No flags
+        
+        links = TLObject.read(b)
+        
+        chats = TLObject.read(b)
+        
+        users = TLObject.read(b)
+        
+        return BusinessChatLinks(links=links, chats=chats, users=users)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.links))
+        
+        b.write(Vector(self.chats))
+        
+        b.write(Vector(self.users))
+        
+        return b.getvalue()
@@ -0,0 +1,89 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SentEmailCode(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.account.SentEmailCode`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``811F854F``
+
+    Parameters:
+        email_pattern (``str``):
+            N/A
+
+        length (``int`` ``32-bit``):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.SendVerifyEmailCode
+    """
+
+    __slots__: List[str] = ["email_pattern", "length"]
+
+    ID = 0x811f854f
+    QUALNAME = "types.account.SentEmailCode"
+
+    def __init__(self, *, email_pattern: str, length: int) -> None:
+        self.email_pattern = email_pattern  # string
+        self.length = length  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SentEmailCode":
+        # No flags
+        
+        email_pattern = String.read(b)
+        
+        length = Int.read(b)
+        
+        return SentEmailCode(email_pattern=email_pattern, length=length)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.email_pattern))
+        
+        b.write(Int(self.length))
+        
+        return b.getvalue()
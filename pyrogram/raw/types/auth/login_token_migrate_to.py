@@ -0,0 +1,90 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class LoginTokenMigrateTo(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.auth.LoginToken`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``68E9916``
+
+    Parameters:
+        dc_id (``int`` ``32-bit``):
+            N/A
+
+        token (``bytes``):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            auth.ExportLoginToken
+            auth.ImportLoginToken
+    """
+
+    __slots__: List[str] = ["dc_id", "token"]
+
+    ID = 0x68e9916
+    QUALNAME = "types.auth.LoginTokenMigrateTo"
+
+    def __init__(self, *, dc_id: int, token: bytes) -> None:
+        self.dc_id = dc_id  # int
+        self.token = token  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "LoginTokenMigrateTo":
+        # No flags
+        
+        dc_id = Int.read(b)
+        
+        token = Bytes.read(b)
+        
+        return LoginTokenMigrateTo(dc_id=dc_id, token=token)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.dc_id))
+        
+        b.write(Bytes(self.token))
+        
+        return b.getvalue()
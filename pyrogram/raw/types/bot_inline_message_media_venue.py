@@ -0,0 +1,124 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class BotInlineMessageMediaVenue(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.BotInlineMessage`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``8A86659C``
+
+    Parameters:
+        geo (:obj:`GeoPoint <pyrogram.raw.base.GeoPoint>`):
+            N/A
+
+        title (``str``):
+            N/A
+
+        address (``str``):
+            N/A
+
+        provider (``str``):
+            N/A
+
+        venue_id (``str``):
+            N/A
+
+        venue_type (``str``):
+            N/A
+
+        reply_markup (:obj:`ReplyMarkup <pyrogram.raw.base.ReplyMarkup>`, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["geo", "title", "address", "provider", "venue_id", "venue_type", "reply_markup"]
+
+    ID = 0x8a86659c
+    QUALNAME = "types.BotInlineMessageMediaVenue"
+
+    def __init__(self, *, geo: "raw.base.GeoPoint", title: str, address: str, provider: str, venue_id: str, venue_type: str, reply_markup: "raw.base.ReplyMarkup" = None) -> None:
+        self.geo = geo  # GeoPoint
+        self.title = title  # string
+        self.address = address  # string
+        self.provider = provider  # string
+        self.venue_id = venue_id  # string
+        self.venue_type = venue_type  # string
+        self.reply_markup = reply_markup  # flags.2?ReplyMarkup
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "BotInlineMessageMediaVenue":
+        
+        flags = Int.read(b)
+        
+        geo = TLObject.read(b)
+        
+        title = String.read(b)
+        
+        address = String.read(b)
+        
+        provider = String.read(b)
+        
+        venue_id = String.read(b)
+        
+        venue_type = String.read(b)
+        
+        reply_markup = TLObject.read(b) if flags & (1 << 2) else None
+        
+        return BotInlineMessageMediaVenue(geo=geo, title=title, address=address, provider=provider, venue_id=venue_id, venue_type=venue_type, reply_markup=reply_markup)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 2) if self.reply_markup is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.geo.write())
+        
+        b.write(String(self.title))
+        
+        b.write(String(self.address))
+        
+        b.write(String(self.provider))
+        
+        b.write(String(self.venue_id))
+        
+        b.write(String(self.venue_type))
+        
+        if self.reply_markup is not None:
+            b.write(self.reply_markup.write())
+        
+        return b.getvalue()
@@ -0,0 +1,91 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class BotPreviewMedia(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.BotPreviewMedia`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``23E91BA3``
+
+    Parameters:
+        date (``int`` ``32-bit``):
+            N/A
+
+        media (:obj:`MessageMedia <pyrogram.raw.base.MessageMedia>`):
+            N/A
+
+    Functions:
+        This object can be returned by 3 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            bots.AddPreviewMedia
+            bots.EditPreviewMedia
+            bots.GetPreviewMedias
+    """
+
+    __slots__: List[str] = ["date", "media"]
+
+    ID = 0x23e91ba3
+    QUALNAME = "types.BotPreviewMedia"
+
+    def __init__(self, *, date: int, media: "raw.base.MessageMedia") -> None:
+        self.date = date  # int
+        self.media = media  # MessageMedia
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "BotPreviewMedia":
+        # No flags
+        
+        date = Int.read(b)
+        
+        media = TLObject.read(b)
+        
+        return BotPreviewMedia(date=date, media=media)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.date))
+        
+        b.write(self.media.write())
+        
+        return b.getvalue()
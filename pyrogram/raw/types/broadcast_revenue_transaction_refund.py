@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class BroadcastRevenueTransactionRefund(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.BroadcastRevenueTransaction`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``42D30D2E``
+
+    Parameters:
+        amount (``int`` ``64-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        provider (``str``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["amount", "date", "provider"]
+
+    ID = 0x42d30d2e
+    QUALNAME = "types.BroadcastRevenueTransactionRefund"
+
+    def __init__(self, *, amount: int, date: int, provider: str) -> None:
+        self.amount = amount  # long
+        self.date = date  # int
+        self.provider = provider  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "BroadcastRevenueTransactionRefund":
+        # No flags
+        
+        amount = Long.read(b)
+        
+        date = Int.read(b)
+        
+        provider = String.read(b)
+        
+        return BroadcastRevenueTransactionRefund(amount=amount, date=date, provider=provider)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.amount))
+        
+        b.write(Int(self.date))
+        
+        b.write(String(self.provider))
+        
+        return b.getvalue()
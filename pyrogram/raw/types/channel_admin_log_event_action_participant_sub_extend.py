@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ChannelAdminLogEventActionParticipantSubExtend(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.ChannelAdminLogEventAction`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``64642DB3``
+
+    Parameters:
+        prev_participant (:obj:`ChannelParticipant <pyrogram.raw.base.ChannelParticipant>`):
+            N/A
+
+        new_participant (:obj:`ChannelParticipant <pyrogram.raw.base.ChannelParticipant>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["prev_participant", "new_participant"]
+
+    ID = 0x64642db3
+    QUALNAME = "types.ChannelAdminLogEventActionParticipantSubExtend"
+
+    def __init__(self, *, prev_participant: "raw.base.ChannelParticipant", new_participant: "raw.base.ChannelParticipant") -> None:
+        self.prev_participant = prev_participant  # ChannelParticipant
+        self.new_participant = new_participant  # ChannelParticipant
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ChannelAdminLogEventActionParticipantSubExtend":
+        # No flags
+        
+        prev_participant = TLObject.read(b)
+        
+        new_participant = TLObject.read(b)
+        
+        return ChannelAdminLogEventActionParticipantSubExtend(prev_participant=prev_participant, new_participant=new_participant)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.prev_participant.write())
+        
+        b.write(self.new_participant.write())
+        
+        return b.getvalue()
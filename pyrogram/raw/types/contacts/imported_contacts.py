@@ -0,0 +1,105 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ImportedContacts(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.contacts.ImportedContacts`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``77D01C3B``
+
+    Parameters:
+        imported (List of :obj:`ImportedContact <pyrogram.raw.base.ImportedContact>`):
+            N/A
+
+        popular_invites (List of :obj:`PopularContact <pyrogram.raw.base.PopularContact>`):
+            N/A
+
+        retry_contacts (List of ``int`` ``64-bit``):
+            N/A
+
+        users (List of :obj:`User <pyrogram.raw.base.User>`):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            contacts.ImportContacts
+    """
+
+    __slots__: List[str] = ["imported", "popular_invites", "retry_contacts", "users"]
+
+    ID = 0x77d01c3b
+    QUALNAME = "types.contacts.ImportedContacts"
+
+    def __init__(self, *, imported: List["raw.base.ImportedContact"], popular_invites: List["raw.base.PopularContact"], retry_contacts: List[int], users: List["raw.base.User"]) -> None:
+        self.imported = imported  # Vector<ImportedContact>
+        self.popular_invites = popular_invites  # Vector<PopularContact>
+        self.retry_contacts = retry_contacts  # Vector<long>
+        self.users = users  # Vector<User>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ImportedContacts":
+        # No flags
+        
+        imported = TLObject.read(b)
+        
+        popular_invites = TLObject.read(b)
+        
+        retry_contacts = TLObject.read(b, Long)
+        
+        users = TLObject.read(b)
+        
+        return ImportedContacts(imported=imported, popular_invites=popular_invites, retry_contacts=retry_contacts, users=users)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.imported))
+        
+        b.write(Vector(self.popular_invites))
+        
+        b.write(Vector(self.retry_contacts, Long))
+        
+        b.write(Vector(self.users))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EmojiGroupPremium(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.EmojiGroup`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``93BCF34``
+
+    Parameters:
+        title (``str``):
+            N/A
+
+        icon_emoji_id (``int`` ``64-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["title", "icon_emoji_id"]
+
+    ID = 0x93bcf34
+    QUALNAME = "types.EmojiGroupPremium"
+
+    def __init__(self, *, title: str, icon_emoji_id: int) -> None:
+        self.title = title  # string
+        self.icon_emoji_id = icon_emoji_id  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EmojiGroupPremium":
+        # No flags
+        
+        title = String.read(b)
+        
+        icon_emoji_id = Long.read(b)
+        
+        return EmojiGroupPremium(title=title, icon_emoji_id=icon_emoji_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.title))
+        
+        b.write(Long(self.icon_emoji_id))
+        
+        return b.getvalue()
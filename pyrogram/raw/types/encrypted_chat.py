@@ -0,0 +1,130 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EncryptedChat(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.EncryptedChat`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``61F0D4C7``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        access_hash (``int`` ``64-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        admin_id (``int`` ``64-bit``):
+            N/A
+
+        participant_id (``int`` ``64-bit``):
+            N/A
+
+        g_a_or_b (``bytes``):
+            N/A
+
+        key_fingerprint (``int`` ``64-bit``):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.RequestEncryption
+            messages.AcceptEncryption
+    """
+
+    __slots__: List[str] = ["id", "access_hash", "date", "admin_id", "participant_id", "g_a_or_b", "key_fingerprint"]
+
+    ID = 0x61f0d4c7
+    QUALNAME = "types.EncryptedChat"
+
+    def __init__(self, *, id: int, access_hash: int, date: int, admin_id: int, participant_id: int, g_a_or_b: bytes, key_fingerprint: int) -> None:
+        self.id = id  # int
+        self.access_hash = access_hash  # long
+        self.date = date  # int
+        self.admin_id = admin_id  # long
+        self.participant_id = participant_id  # long
+        self.g_a_or_b = g_a_or_b  # bytes
+        self.key_fingerprint = key_fingerprint  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EncryptedChat":
+        # No flags
+        
+        id = Int.read(b)
+        
+        access_hash = Long.read(b)
+        
+        date = Int.read(b)
+        
+        admin_id = Long.read(b)
+        
+        participant_id = Long.read(b)
+        
+        g_a_or_b = Bytes.read(b)
+        
+        key_fingerprint = Long.read(b)
+        
+        return EncryptedChat(id=id, access_hash=access_hash, date=date, admin_id=admin_id, participant_id=participant_id, g_a_or_b=g_a_or_b, key_fingerprint=key_fingerprint)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.id))
+        
+        b.write(Long(self.access_hash))
+        
+        b.write(Int(self.date))
+        
+        b.write(Long(self.admin_id))
+        
+        b.write(Long(self.participant_id))
+        
+        b.write(Bytes(self.g_a_or_b))
+        
+        b.write(Long(self.key_fingerprint))
+        
+        return b.getvalue()
@@ -0,0 +1,104 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EncryptedMessage(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.EncryptedMessage`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``ED18C118``
+
+    Parameters:
+        random_id (``int`` ``64-bit``):
+            N/A
+
+        chat_id (``int`` ``32-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        bytes (``bytes``):
+            N/A
+
+        file (:obj:`EncryptedFile <pyrogram.raw.base.EncryptedFile>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["random_id", "chat_id", "date", "bytes", "file"]
+
+    ID = 0xed18c118
+    QUALNAME = "types.EncryptedMessage"
+
+    def __init__(self, *, random_id: int, chat_id: int, date: int, bytes: bytes, file: "raw.base.EncryptedFile") -> None:
+        self.random_id = random_id  # long
+        self.chat_id = chat_id  # int
+        self.date = date  # int
+        self.bytes = bytes  # bytes
+        self.file = file  # EncryptedFile
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EncryptedMessage":
+        # No flags
+        
+        random_id = Long.read(b)
+        
+        chat_id = Int.read(b)
+        
+        date = Int.read(b)
+        
+        bytes = Bytes.read(b)
+        
+        file = TLObject.read(b)
+        
+        return EncryptedMessage(random_id=random_id, chat_id=chat_id, date=date, bytes=bytes, file=file)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.random_id))
+        
+        b.write(Int(self.chat_id))
+        
+        b.write(Int(self.date))
+        
+        b.write(Bytes(self.bytes))
+        
+        b.write(self.file.write())
+        
+        return b.getvalue()
@@ -0,0 +1,134 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputBotInlineMessageMediaInvoice(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputBotInlineMessage`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``D7E78225``
+
+    Parameters:
+        title (``str``):
+            N/A
+
+        description (``str``):
+            N/A
+
+        invoice (:obj:`Invoice <pyrogram.raw.base.Invoice>`):
+            N/A
+
+        payload (``bytes``):
+            N/A
+
+        provider (``str``):
+            N/A
+
+        provider_data (:obj:`DataJSON <pyrogram.raw.base.DataJSON>`):
+            N/A
+
+        photo (:obj:`InputWebDocument <pyrogram.raw.base.InputWebDocument>`, *optional*):
+            N/A
+
+        reply_markup (:obj:`ReplyMarkup <pyrogram.raw.base.ReplyMarkup>`, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["title", "description", "invoice", "payload", "provider", "provider_data", "photo", "reply_markup"]
+
+    ID = 0xd7e78225
+    QUALNAME = "types.InputBotInlineMessageMediaInvoice"
+
+    def __init__(self, *, title: str, description: str, invoice: "raw.base.Invoice", payload: bytes, provider: str, provider_data: "raw.base.DataJSON", photo: "raw.base.InputWebDocument" = None, reply_markup: "raw.base.ReplyMarkup" = None) -> None:
+        self.title = title  # string
+        self.description = description  # string
+        self.invoice = invoice  # Invoice
+        self.payload = payload  # bytes
+        self.provider = provider  # string
+        self.provider_data = provider_data  # DataJSON
+        self.photo = photo  # flags.0?InputWebDocument
+        self.reply_markup = reply_markup  # flags.2?ReplyMarkup
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputBotInlineMessageMediaInvoice":
+        
+        flags = Int.read(b)
+        
+        title = String.read(b)
+        
+        description = String.read(b)
+        
+        photo = TLObject.read(b) if flags & (1 << 0) else None
+        
+        invoice = TLObject.read(b)
+        
+        payload = Bytes.read(b)
+        
+        provider = String.read(b)
+        
+        provider_data = TLObject.read(b)
+        
+        reply_markup = TLObject.read(b) if flags & (1 << 2) else None
+        
+        return InputBotInlineMessageMediaInvoice(title=title, description=description, invoice=invoice, payload=payload, provider=provider, provider_data=provider_data, photo=photo, reply_markup=reply_markup)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.photo is not None else 0
+        flags |= (1 << 2) if self.reply_markup is not None else 0
+        b.write(Int(flags))
+        
+        b.write(String(self.title))
+        
+        b.write(String(self.description))
+        
+        if self.photo is not None:
+            b.write(self.photo.write())
+        
+        b.write(self.invoice.write())
+        
+        b.write(Bytes(self.payload))
+        
+        b.write(String(self.provider))
+        
+        b.write(self.provider_data.write())
+        
+        if self.reply_markup is not None:
+            b.write(self.reply_markup.write())
+        
+        return b.getvalue()
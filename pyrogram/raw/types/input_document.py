@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputDocument(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputDocument`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``1ABFB575``
+
+    Parameters:
+        id (``int`` ``64-bit``):
+            N/A
+
+        access_hash (``int`` ``64-bit``):
+            N/A
+
+        file_reference (``bytes``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "access_hash", "file_reference"]
+
+    ID = 0x1abfb575
+    QUALNAME = "types.InputDocument"
+
+    def __init__(self, *, id: int, access_hash: int, file_reference: bytes) -> None:
+        self.id = id  # long
+        self.access_hash = access_hash  # long
+        self.file_reference = file_reference  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputDocument":
+        # No flags
+        
+        id = Long.read(b)
+        
+        access_hash = Long.read(b)
+        
+        file_reference = Bytes.read(b)
+        
+        return InputDocument(id=id, access_hash=access_hash, file_reference=file_reference)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.id))
+        
+        b.write(Long(self.access_hash))
+        
+        b.write(Bytes(self.file_reference))
+        
+        return b.getvalue()
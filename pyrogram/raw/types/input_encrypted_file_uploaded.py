@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputEncryptedFileUploaded(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputEncryptedFile`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``64BD0306``
+
+    Parameters:
+        id (``int`` ``64-bit``):
+            N/A
+
+        parts (``int`` ``32-bit``):
+            N/A
+
+        md5_checksum (``str``):
+            N/A
+
+        key_fingerprint (``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "parts", "md5_checksum", "key_fingerprint"]
+
+    ID = 0x64bd0306
+    QUALNAME = "types.InputEncryptedFileUploaded"
+
+    def __init__(self, *, id: int, parts: int, md5_checksum: str, key_fingerprint: int) -> None:
+        self.id = id  # long
+        self.parts = parts  # int
+        self.md5_checksum = md5_checksum  # string
+        self.key_fingerprint = key_fingerprint  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputEncryptedFileUploaded":
+        # No flags
+        
+        id = Long.read(b)
+        
+        parts = Int.read(b)
+        
+        md5_checksum = String.read(b)
+        
+        key_fingerprint = Int.read(b)
+        
+        return InputEncryptedFileUploaded(id=id, parts=parts, md5_checksum=md5_checksum, key_fingerprint=key_fingerprint)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.id))
+        
+        b.write(Int(self.parts))
+        
+        b.write(String(self.md5_checksum))
+        
+        b.write(Int(self.key_fingerprint))
+        
+        return b.getvalue()
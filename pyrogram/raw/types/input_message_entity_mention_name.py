@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputMessageEntityMentionName(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.MessageEntity`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``208E68C9``
+
+    Parameters:
+        offset (``int`` ``32-bit``):
+            N/A
+
+        length (``int`` ``32-bit``):
+            N/A
+
+        user_id (:obj:`InputUser <pyrogram.raw.base.InputUser>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["offset", "length", "user_id"]
+
+    ID = 0x208e68c9
+    QUALNAME = "types.InputMessageEntityMentionName"
+
+    def __init__(self, *, offset: int, length: int, user_id: "raw.base.InputUser") -> None:
+        self.offset = offset  # int
+        self.length = length  # int
+        self.user_id = user_id  # InputUser
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputMessageEntityMentionName":
+        # No flags
+        
+        offset = Int.read(b)
+        
+        length = Int.read(b)
+        
+        user_id = TLObject.read(b)
+        
+        return InputMessageEntityMentionName(offset=offset, length=length, user_id=user_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.offset))
+        
+        b.write(Int(self.length))
+        
+        b.write(self.user_id.write())
+        
+        return b.getvalue()
@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputPaymentCredentialsGooglePay(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputPaymentCredentials`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``8AC32801``
+
+    Parameters:
+        payment_token (:obj:`DataJSON <pyrogram.raw.base.DataJSON>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["payment_token"]
+
+    ID = 0x8ac32801
+    QUALNAME = "types.InputPaymentCredentialsGooglePay"
+
+    def __init__(self, *, payment_token: "raw.base.DataJSON") -> None:
+        self.payment_token = payment_token  # DataJSON
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputPaymentCredentialsGooglePay":
+        # No flags
+        
+        payment_token = TLObject.read(b)
+        
+        return InputPaymentCredentialsGooglePay(payment_token=payment_token)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.payment_token.write())
+        
+        return b.getvalue()
@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputPhoneContact(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputContact`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``F392B7F4``
+
+    Parameters:
+        client_id (``int`` ``64-bit``):
+            N/A
+
+        phone (``str``):
+            N/A
+
+        first_name (``str``):
+            N/A
+
+        last_name (``str``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["client_id", "phone", "first_name", "last_name"]
+
+    ID = 0xf392b7f4
+    QUALNAME = "types.InputPhoneContact"
+
+    def __init__(self, *, client_id: int, phone: str, first_name: str, last_name: str) -> None:
+        self.client_id = client_id  # long
+        self.phone = phone  # string
+        self.first_name = first_name  # string
+        self.last_name = last_name  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputPhoneContact":
+        # No flags
+        
+        client_id = Long.read(b)
+        
+        phone = String.read(b)
+        
+        first_name = String.read(b)
+        
+        last_name = String.read(b)
+        
+        return InputPhoneContact(client_id=client_id, phone=phone, first_name=first_name, last_name=last_name)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.client_id))
+        
+        b.write(String(self.phone))
+        
+        b.write(String(self.first_name))
+        
+        b.write(String(self.last_name))
+        
+        return b.getvalue()
@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputQuickReplyShortcutId(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputQuickReplyShortcut`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``1190CF1``
+
+    Parameters:
+        shortcut_id (``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["shortcut_id"]
+
+    ID = 0x1190cf1
+    QUALNAME = "types.InputQuickReplyShortcutId"
+
+    def __init__(self, *, shortcut_id: int) -> None:
+        self.shortcut_id = shortcut_id  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputQuickReplyShortcutId":
+        # No flags
+        
+        shortcut_id = Int.read(b)
+        
+        return InputQuickReplyShortcutId(shortcut_id=shortcut_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.shortcut_id))
+        
+        return b.getvalue()
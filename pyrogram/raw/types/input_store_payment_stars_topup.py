@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputStorePaymentStarsTopup(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.InputStorePaymentPurpose`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``DDDD0F56``
+
+    Parameters:
+        stars (``int`` ``64-bit``):
+            N/A
+
+        currency (``str``):
+            N/A
+
+        amount (``int`` ``64-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["stars", "currency", "amount"]
+
+    ID = 0xdddd0f56
+    QUALNAME = "types.InputStorePaymentStarsTopup"
+
+    def __init__(self, *, stars: int, currency: str, amount: int) -> None:
+        self.stars = stars  # long
+        self.currency = currency  # string
+        self.amount = amount  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputStorePaymentStarsTopup":
+        # No flags
+        
+        stars = Long.read(b)
+        
+        currency = String.read(b)
+        
+        amount = Long.read(b)
+        
+        return InputStorePaymentStarsTopup(stars=stars, currency=currency, amount=amount)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.stars))
+        
+        b.write(String(self.currency))
+        
+        b.write(Long(self.amount))
+        
+        return b.getvalue()
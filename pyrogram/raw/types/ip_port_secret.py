@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class IpPortSecret(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.IpPort`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``37982646``
+
+    Parameters:
+        ipv4 (``int`` ``32-bit``):
+            N/A
+
+        port (``int`` ``32-bit``):
+            N/A
+
+        secret (``bytes``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["ipv4", "port", "secret"]
+
+    ID = 0x37982646
+    QUALNAME = "types.IpPortSecret"
+
+    def __init__(self, *, ipv4: int, port: int, secret: bytes) -> None:
+        self.ipv4 = ipv4  # int
+        self.port = port  # int
+        self.secret = secret  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "IpPortSecret":
+        # No flags
+        
+        ipv4 = Int.read(b)
+        
+        port = Int.read(b)
+        
+        secret = Bytes.read(b)
+        
+        return IpPortSecret(ipv4=ipv4, port=port, secret=secret)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.ipv4))
+        
+        b.write(Int(self.port))
+        
+        b.write(Bytes(self.secret))
+        
+        return b.getvalue()
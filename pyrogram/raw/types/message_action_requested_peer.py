@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class MessageActionRequestedPeer(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.MessageAction`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``31518E9B``
+
+    Parameters:
+        button_id (``int`` ``32-bit``):
+            N/A
+
+        peers (List of :obj:`Peer <pyrogram.raw.base.Peer>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["button_id", "peers"]
+
+    ID = 0x31518e9b
+    QUALNAME = "types.MessageActionRequestedPeer"
+
+    def __init__(self, *, button_id: int, peers: List["raw.base.Peer"]) -> None:
+        self.button_id = button_id  # int
+        self.peers = peers  # Vector<Peer>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "MessageActionRequestedPeer":
+        # No flags
+        
+        button_id = Int.read(b)
+        
+        peers = TLObject.read(b)
+        
+        return MessageActionRequestedPeer(button_id=button_id, peers=peers)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.button_id))
+        
+        b.write(Vector(self.peers))
+        
+        return b.getvalue()
@@ -0,0 +1,145 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class MessageActionStarGiftUnique(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.MessageAction`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``ACDFCB81``
+
+    Parameters:
+        gift (:obj:`StarGift <pyrogram.raw.base.StarGift>`):
+            N/A
+
+        upgrade (``bool``, *optional*):
+            N/A
+
+        transferred (``bool``, *optional*):
+            N/A
+
+        saved (``bool``, *optional*):
+            N/A
+
+        refunded (``bool``, *optional*):
+            N/A
+
+        can_export_at (``int`` ``32-bit``, *optional*):
+            N/A
+
+        transfer_stars (``int`` ``64-bit``, *optional*):
+            N/A
+
+        from_id (:obj:`Peer <pyrogram.raw.base.Peer>`, *optional*):
+            N/A
+
+        peer (:obj:`Peer <pyrogram.raw.base.Peer>`, *optional*):
+            N/A
+
+        saved_id (``int`` ``64-bit``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["gift", "upgrade", "transferred", "saved", "refunded", "can_export_at", "transfer_stars", "from_id", "peer", "saved_id"]
+
+    ID = 0xacdfcb81
+    QUALNAME = "types.MessageActionStarGiftUnique"
+
+    def __init__(self, *, gift: "raw.base.StarGift", upgrade: Optional[bool] = None, transferred: Optional[bool] = None, saved: Optional[bool] = None, refunded: Optional[bool] = None, can_export_at: Optional[int] = None, transfer_stars: Optional[int] = None, from_id: "raw.base.Peer" = None, peer: "raw.base.Peer" = None, saved_id: Optional[int] = None) -> None:
+        self.gift = gift  # StarGift
+        self.upgrade = upgrade  # flags.0?true
+        self.transferred = transferred  # flags.1?true
+        self.saved = saved  # flags.2?true
+        self.refunded = refunded  # flags.5?true
+        self.can_export_at = can_export_at  # flags.3?int
+        self.transfer_stars = transfer_stars  # flags.4?long
+        self.from_id = from_id  # flags.6?Peer
+        self.peer = peer  # flags.7?Peer
+        self.saved_id = saved_id  # flags.7?long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "MessageActionStarGiftUnique":
+        
+        flags = Int.read(b)
+        
+        upgrade = True if flags & (1 << 0) else False
+        transferred = True if flags & (1 << 1) else False
+        saved = True if flags & (1 << 2) else False
+        refunded = True if flags & (1 << 5) else False
+        gift = TLObject.read(b)
+        
+        can_export_at = Int.read(b) if flags & (1 << 3) else None
+        transfer_stars = Long.read(b) if flags & (1 << 4) else None
+        from_id = TLObject.read(b) if flags & (1 << 6) else None
+        
+        peer = TLObject.read(b) if flags & (1 << 7) else None
+        
+        saved_id = Long.read(b) if flags & (1 << 7) else None
+        return MessageActionStarGiftUnique(gift=gift, upgrade=upgrade, transferred=transferred, saved=saved, refunded=refunded, can_export_at=can_export_at, transfer_stars=transfer_stars, from_id=from_id, peer=peer, saved_id=saved_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.upgrade else 0
+        flags |= (1 << 1) if self.transferred else 0
+        flags |= (1 << 2) if self.saved else 0
+        flags |= (1 << 5) if self.refunded else 0
+        flags |= (1 << 3) if self.can_export_at is not None else 0
+        flags |= (1 << 4) if self.transfer_stars is not None else 0
+        flags |= (1 << 6) if self.from_id is not None else 0
+        flags |= (1 << 7) if self.peer is not None else 0
+        flags |= (1 << 7) if self.saved_id is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.gift.write())
+        
+        if self.can_export_at is not None:
+            b.write(Int(self.can_export_at))
+        
+        if self.transfer_stars is not None:
+            b.write(Long(self.transfer_stars))
+        
+        if self.from_id is not None:
+            b.write(self.from_id.write())
+        
+        if self.peer is not None:
+            b.write(self.peer.write())
+        
+        if self.saved_id is not None:
+            b.write(Long(self.saved_id))
+        
+        return b.getvalue()
@@ -0,0 +1,92 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EmojiGroups(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.messages.EmojiGroups`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``881FB94B``
+
+    Parameters:
+        hash (``int`` ``32-bit``):
+            N/A
+
+        groups (List of :obj:`EmojiGroup <pyrogram.raw.base.EmojiGroup>`):
+            N/A
+
+    Functions:
+        This object can be returned by 4 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.GetEmojiGroups
+            messages.GetEmojiStatusGroups
+            messages.GetEmojiProfilePhotoGroups
+            messages.GetEmojiStickerGroups
+    """
+
+    __slots__: List[str] = ["hash", "groups"]
+
+    ID = 0x881fb94b
+    QUALNAME = "types.messages.EmojiGroups"
+
+    def __init__(self, *, hash: int, groups: List["raw.base.EmojiGroup"]) -> None:
+        self.hash = hash  # int
+        self.groups = groups  # Vector<EmojiGroup>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EmojiGroups":
+        # No flags
+        
+        hash = Int.read(b)
+        
+        groups = TLObject.read(b)
+        
+        return EmojiGroups(hash=hash, groups=groups)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.hash))
+        
+        b.write(Vector(self.groups))
+        
+        return b.getvalue()
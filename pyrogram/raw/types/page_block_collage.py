@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PageBlockCollage(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.PageBlock`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``65A0FA4D``
+
+    Parameters:
+        items (List of :obj:`PageBlock <pyrogram.raw.base.PageBlock>`):
+            N/A
+
+        caption (:obj:`PageCaption <pyrogram.raw.base.PageCaption>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["items", "caption"]
+
+    ID = 0x65a0fa4d
+    QUALNAME = "types.PageBlockCollage"
+
+    def __init__(self, *, items: List["raw.base.PageBlock"], caption: "raw.base.PageCaption") -> None:
+        self.items = items  # Vector<PageBlock>
+        self.caption = caption  # PageCaption
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PageBlockCollage":
+        # No flags
+        
+        items = TLObject.read(b)
+        
+        caption = TLObject.read(b)
+        
+        return PageBlockCollage(items=items, caption=caption)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.items))
+        
+        b.write(self.caption.write())
+        
+        return b.getvalue()
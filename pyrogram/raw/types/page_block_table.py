@@ -0,0 +1,94 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PageBlockTable(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.PageBlock`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``BF4DEA82``
+
+    Parameters:
+        title (:obj:`RichText <pyrogram.raw.base.RichText>`):
+            N/A
+
+        rows (List of :obj:`PageTableRow <pyrogram.raw.base.PageTableRow>`):
+            N/A
+
+        bordered (``bool``, *optional*):
+            N/A
+
+        striped (``bool``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["title", "rows", "bordered", "striped"]
+
+    ID = 0xbf4dea82
+    QUALNAME = "types.PageBlockTable"
+
+    def __init__(self, *, title: "raw.base.RichText", rows: List["raw.base.PageTableRow"], bordered: Optional[bool] = None, striped: Optional[bool] = None) -> None:
+        self.title = title  # RichText
+        self.rows = rows  # Vector<PageTableRow>
+        self.bordered = bordered  # flags.0?true
+        self.striped = striped  # flags.1?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PageBlockTable":
+        
+        flags = Int.read(b)
+        
+        bordered = True if flags & (1 << 0) else False
+        striped = True if flags & (1 << 1) else False
+        title = TLObject.read(b)
+        
+        rows = TLObject.read(b)
+        
+        return PageBlockTable(title=title, rows=rows, bordered=bordered, striped=striped)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.bordered else 0
+        flags |= (1 << 1) if self.striped else 0
+        b.write(Int(flags))
+        
+        b.write(self.title.write())
+        
+        b.write(Vector(self.rows))
+        
+        return b.getvalue()
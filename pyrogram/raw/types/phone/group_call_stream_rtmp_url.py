@@ -0,0 +1,89 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GroupCallStreamRtmpUrl(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.phone.GroupCallStreamRtmpUrl`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``2DBF3432``
+
+    Parameters:
+        url (``str``):
+            N/A
+
+        key (``str``):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            phone.GetGroupCallStreamRtmpUrl
+    """
+
+    __slots__: List[str] = ["url", "key"]
+
+    ID = 0x2dbf3432
+    QUALNAME = "types.phone.GroupCallStreamRtmpUrl"
+
+    def __init__(self, *, url: str, key: str) -> None:
+        self.url = url  # string
+        self.key = key  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GroupCallStreamRtmpUrl":
+        # No flags
+        
+        url = String.read(b)
+        
+        key = String.read(b)
+        
+        return GroupCallStreamRtmpUrl(url=url, key=key)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(String(self.key))
+        
+        return b.getvalue()
@@ -0,0 +1,138 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PhoneCallAccepted(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.PhoneCall`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``22FD7181``
+
+    Parameters:
+        id (``int`` ``64-bit``):
+            N/A
+
+        access_hash (``int`` ``64-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        admin_id (``int`` ``64-bit``):
+            N/A
+
+        participant_id (``int`` ``64-bit``):
+            N/A
+
+        g_b (``bytes``):
+            N/A
+
+        protocol (:obj:`PhoneCallProtocol <pyrogram.raw.base.PhoneCallProtocol>`):
+            N/A
+
+        video (``bool``, *optional*):
+            N/A
+
+        conference_call (:obj:`InputGroupCall <pyrogram.raw.base.InputGroupCall>`, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "access_hash", "date", "admin_id", "participant_id", "g_b", "protocol", "video", "conference_call"]
+
+    ID = 0x22fd7181
+    QUALNAME = "types.PhoneCallAccepted"
+
+    def __init__(self, *, id: int, access_hash: int, date: int, admin_id: int, participant_id: int, g_b: bytes, protocol: "raw.base.PhoneCallProtocol", video: Optional[bool] = None, conference_call: "raw.base.InputGroupCall" = None) -> None:
+        self.id = id  # long
+        self.access_hash = access_hash  # long
+        self.date = date  # int
+        self.admin_id = admin_id  # long
+        self.participant_id = participant_id  # long
+        self.g_b = g_b  # bytes
+        self.protocol = protocol  # PhoneCallProtocol
+        self.video = video  # flags.6?true
+        self.conference_call = conference_call  # flags.8?InputGroupCall
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PhoneCallAccepted":
+        
+        flags = Int.read(b)
+        
+        video = True if flags & (1 << 6) else False
+        id = Long.read(b)
+        
+        access_hash = Long.read(b)
+        
+        date = Int.read(b)
+        
+        admin_id = Long.read(b)
+        
+        participant_id = Long.read(b)
+        
+        g_b = Bytes.read(b)
+        
+        protocol = TLObject.read(b)
+        
+        conference_call = TLObject.read(b) if flags & (1 << 8) else None
+        
+        return PhoneCallAccepted(id=id, access_hash=access_hash, date=date, admin_id=admin_id, participant_id=participant_id, g_b=g_b, protocol=protocol, video=video, conference_call=conference_call)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 6) if self.video else 0
+        flags |= (1 << 8) if self.conference_call is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Long(self.id))
+        
+        b.write(Long(self.access_hash))
+        
+        b.write(Int(self.date))
+        
+        b.write(Long(self.admin_id))
+        
+        b.write(Long(self.participant_id))
+        
+        b.write(Bytes(self.g_b))
+        
+        b.write(self.protocol.write())
+        
+        if self.conference_call is not None:
+            b.write(self.conference_call.write())
+        
+        return b.getvalue()
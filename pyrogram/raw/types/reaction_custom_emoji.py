@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ReactionCustomEmoji(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Reaction`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``8935FC73``
+
+    Parameters:
+        document_id (``int`` ``64-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["document_id"]
+
+    ID = 0x8935fc73
+    QUALNAME = "types.ReactionCustomEmoji"
+
+    def __init__(self, *, document_id: int) -> None:
+        self.document_id = document_id  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ReactionCustomEmoji":
+        # No flags
+        
+        document_id = Long.read(b)
+        
+        return ReactionCustomEmoji(document_id=document_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.document_id))
+        
+        return b.getvalue()
@@ -0,0 +1,89 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ReceivedNotifyMessage(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.ReceivedNotifyMessage`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``A384B779``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        flags (``int`` ``32-bit``):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.ReceivedMessages
+    """
+
+    __slots__: List[str] = ["id", "flags"]
+
+    ID = 0xa384b779
+    QUALNAME = "types.ReceivedNotifyMessage"
+
+    def __init__(self, *, id: int, flags: int) -> None:
+        self.id = id  # int
+        self.flags = flags  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ReceivedNotifyMessage":
+        # No flags
+        
+        id = Int.read(b)
+        
+        flags = Int.read(b)
+        
+        return ReceivedNotifyMessage(id=id, flags=flags)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.id))
+        
+        b.write(Int(self.flags))
+        
+        return b.getvalue()
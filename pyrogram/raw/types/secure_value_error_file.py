@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SecureValueErrorFile(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.SecureValueError`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``7A700873``
+
+    Parameters:
+        type (:obj:`SecureValueType <pyrogram.raw.base.SecureValueType>`):
+            N/A
+
+        file_hash (``bytes``):
+            N/A
+
+        text (``str``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["type", "file_hash", "text"]
+
+    ID = 0x7a700873
+    QUALNAME = "types.SecureValueErrorFile"
+
+    def __init__(self, *, type: "raw.base.SecureValueType", file_hash: bytes, text: str) -> None:
+        self.type = type  # SecureValueType
+        self.file_hash = file_hash  # bytes
+        self.text = text  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SecureValueErrorFile":
+        # No flags
+        
+        type = TLObject.read(b)
+        
+        file_hash = Bytes.read(b)
+        
+        text = String.read(b)
+        
+        return SecureValueErrorFile(type=type, file_hash=file_hash, text=text)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.type.write())
+        
+        b.write(Bytes(self.file_hash))
+        
+        b.write(String(self.text))
+        
+        return b.getvalue()
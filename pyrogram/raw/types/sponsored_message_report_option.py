@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SponsoredMessageReportOption(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.SponsoredMessageReportOption`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``430D3150``
+
+    Parameters:
+        text (``str``):
+            N/A
+
+        option (``bytes``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["text", "option"]
+
+    ID = 0x430d3150
+    QUALNAME = "types.SponsoredMessageReportOption"
+
+    def __init__(self, *, text: str, option: bytes) -> None:
+        self.text = text  # string
+        self.option = option  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SponsoredMessageReportOption":
+        # No flags
+        
+        text = String.read(b)
+        
+        option = Bytes.read(b)
+        
+        return SponsoredMessageReportOption(text=text, option=option)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.text))
+        
+        b.write(Bytes(self.option))
+        
+        return b.getvalue()
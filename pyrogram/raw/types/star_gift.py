@@ -0,0 +1,161 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class StarGift(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.StarGift`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``2CC73C8``
+
+    Parameters:
+        id (``int`` ``64-bit``):
+            N/A
+
+        sticker (:obj:`Document <pyrogram.raw.base.Document>`):
+            N/A
+
+        stars (``int`` ``64-bit``):
+            N/A
+
+        convert_stars (``int`` ``64-bit``):
+            N/A
+
+        limited (``bool``, *optional*):
+            N/A
+
+        sold_out (``bool``, *optional*):
+            N/A
+
+        birthday (``bool``, *optional*):
+            N/A
+
+        availability_remains (``int`` ``32-bit``, *optional*):
+            N/A
+
+        availability_total (``int`` ``32-bit``, *optional*):
+            N/A
+
+        first_sale_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+        last_sale_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+        upgrade_stars (``int`` ``64-bit``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "sticker", "stars", "convert_stars", "limited", "sold_out", "birthday", "availability_remains", "availability_total", "first_sale_date", "last_sale_date", "upgrade_stars"]
+
+    ID = 0x2cc73c8
+    QUALNAME = "types.StarGift"
+
+    def __init__(self, *, id: int, sticker: "raw.base.Document", stars: int, convert_stars: int, limited: Optional[bool] = None, sold_out: Optional[bool] = None, birthday: Optional[bool] = None, availability_remains: Optional[int] = None, availability_total: Optional[int] = None, first_sale_date: Optional[int] = None, last_sale_date: Optional[int] = None, upgrade_stars: Optional[int] = None) -> None:
+        self.id = id  # long
+        self.sticker = sticker  # Document
+        self.stars = stars  # long
+        self.convert_stars = convert_stars  # long
+        self.limited = limited  # flags.0?true
+        self.sold_out = sold_out  # flags.1?true
+        self.birthday = birthday  # flags.2?true
+        self.availability_remains = availability_remains  # flags.0?int
+        self.availability_total = availability_total  # flags.0?int
+        self.first_sale_date = first_sale_date  # flags.1?int
+        self.last_sale_date = last_sale_date  # flags.1?int
+        self.upgrade_stars = upgrade_stars  # flags.3?long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "StarGift":
+        
+        flags = Int.read(b)
+        
+        limited = True if flags & (1 << 0) else False
+        sold_out = True if flags & (1 << 1) else False
+        birthday = True if flags & (1 << 2) else False
+        id = Long.read(b)
+        
+        sticker = TLObject.read(b)
+        
+        stars = Long.read(b)
+        
+        availability_remains = Int.read(b) if flags & (1 << 0) else None
+        availability_total = Int.read(b) if flags & (1 << 0) else None
+        convert_stars = Long.read(b)
+        
+        first_sale_date = Int.read(b) if flags & (1 << 1) else None
+        last_sale_date = Int.read(b) if flags & (1 << 1) else None
+        upgrade_stars = Long.read(b) if flags & (1 << 3) else None
+        return StarGift(id=id, sticker=sticker, stars=stars, convert_stars=convert_stars, limited=limited, sold_out=sold_out, birthday=birthday, availability_remains=availability_remains, availability_total=availability_total, first_sale_date=first_sale_date, last_sale_date=last_sale_date, upgrade_stars=upgrade_stars)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.limited else 0
+        flags |= (1 << 1) if self.sold_out else 0
+        flags |= (1 << 2) if self.birthday else 0
+        flags |= (1 << 0) if self.availability_remains is not None else 0
+        flags |= (1 << 0) if self.availability_total is not None else 0
+        flags |= (1 << 1) if self.first_sale_date is not None else 0
+        flags |= (1 << 1) if self.last_sale_date is not None else 0
+        flags |= (1 << 3) if self.upgrade_stars is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Long(self.id))
+        
+        b.write(self.sticker.write())
+        
+        b.write(Long(self.stars))
+        
+        if self.availability_remains is not None:
+            b.write(Int(self.availability_remains))
+        
+        if self.availability_total is not None:
+            b.write(Int(self.availability_total))
+        
+        b.write(Long(self.convert_stars))
+        
+        if self.first_sale_date is not None:
+            b.write(Int(self.first_sale_date))
+        
+        if self.last_sale_date is not None:
+            b.write(Int(self.last_sale_date))
+        
+        if self.upgrade_stars is not None:
+            b.write(Long(self.upgrade_stars))
+        
+        return b.getvalue()
@@ -0,0 +1,104 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateChatParticipantAdd(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``3DDA5451``
+
+    Parameters:
+        chat_id (``int`` ``64-bit``):
+            N/A
+
+        user_id (``int`` ``64-bit``):
+            N/A
+
+        inviter_id (``int`` ``64-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        version (``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["chat_id", "user_id", "inviter_id", "date", "version"]
+
+    ID = 0x3dda5451
+    QUALNAME = "types.UpdateChatParticipantAdd"
+
+    def __init__(self, *, chat_id: int, user_id: int, inviter_id: int, date: int, version: int) -> None:
+        self.chat_id = chat_id  # long
+        self.user_id = user_id  # long
+        self.inviter_id = inviter_id  # long
+        self.date = date  # int
+        self.version = version  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateChatParticipantAdd":
+        # No flags
+        
+        chat_id = Long.read(b)
+        
+        user_id = Long.read(b)
+        
+        inviter_id = Long.read(b)
+        
+        date = Int.read(b)
+        
+        version = Int.read(b)
+        
+        return UpdateChatParticipantAdd(chat_id=chat_id, user_id=user_id, inviter_id=inviter_id, date=date, version=version)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.chat_id))
+        
+        b.write(Long(self.user_id))
+        
+        b.write(Long(self.inviter_id))
+        
+        b.write(Int(self.date))
+        
+        b.write(Int(self.version))
+        
+        return b.getvalue()
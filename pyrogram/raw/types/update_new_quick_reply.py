@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateNewQuickReply(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``F53DA717``
+
+    Parameters:
+        quick_reply (:obj:`QuickReply <pyrogram.raw.base.QuickReply>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["quick_reply"]
+
+    ID = 0xf53da717
+    QUALNAME = "types.UpdateNewQuickReply"
+
+    def __init__(self, *, quick_reply: "raw.base.QuickReply") -> None:
+        self.quick_reply = quick_reply  # QuickReply
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateNewQuickReply":
+        # No flags
+        
+        quick_reply = TLObject.read(b)
+        
+        return UpdateNewQuickReply(quick_reply=quick_reply)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.quick_reply.write())
+        
+        return b.getvalue()
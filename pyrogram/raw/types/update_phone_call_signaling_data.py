@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdatePhoneCallSignalingData(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``2661BF09``
+
+    Parameters:
+        phone_call_id (``int`` ``64-bit``):
+            N/A
+
+        data (``bytes``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["phone_call_id", "data"]
+
+    ID = 0x2661bf09
+    QUALNAME = "types.UpdatePhoneCallSignalingData"
+
+    def __init__(self, *, phone_call_id: int, data: bytes) -> None:
+        self.phone_call_id = phone_call_id  # long
+        self.data = data  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdatePhoneCallSignalingData":
+        # No flags
+        
+        phone_call_id = Long.read(b)
+        
+        data = Bytes.read(b)
+        
+        return UpdatePhoneCallSignalingData(phone_call_id=phone_call_id, data=data)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.phone_call_id))
+        
+        b.write(Bytes(self.data))
+        
+        return b.getvalue()
@@ -0,0 +1,195 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateShort(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Updates`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``78D4DEC1``
+
+    Parameters:
+        update (:obj:`Update <pyrogram.raw.base.Update>`):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+    Functions:
+        This object can be returned by 107 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.GetNotifyExceptions
+            account.UpdateConnectedBot
+            account.GetBotBusinessConnection
+            contacts.DeleteContacts
+            contacts.AddContact
+            contacts.AcceptContact
+            contacts.GetLocated
+            contacts.BlockFromReplies
+            messages.SendMessage
+            messages.SendMedia
+            messages.ForwardMessages
+            messages.EditChatTitle
+            messages.EditChatPhoto
+            messages.DeleteChatUser
+            messages.ImportChatInvite
+            messages.StartBot
+            messages.MigrateChat
+            messages.SendInlineBotResult
+            messages.EditMessage
+            messages.GetAllDrafts
+            messages.SetGameScore
+            messages.SendScreenshotNotification
+            messages.SendMultiMedia
+            messages.UpdatePinnedMessage
+            messages.SendVote
+            messages.GetPollResults
+            messages.EditChatDefaultBannedRights
+            messages.SendScheduledMessages
+            messages.DeleteScheduledMessages
+            messages.SetHistoryTTL
+            messages.SetChatTheme
+            messages.HideChatJoinRequest
+            messages.HideAllChatJoinRequests
+            messages.ToggleNoForwards
+            messages.SendReaction
+            messages.GetMessagesReactions
+            messages.SetChatAvailableReactions
+            messages.SendWebViewData
+            messages.GetExtendedMedia
+            messages.SendBotRequestedPeer
+            messages.SetChatWallPaper
+            messages.SendQuickReplyMessages
+            messages.DeleteQuickReplyMessages
+            messages.EditFactCheck
+            messages.DeleteFactCheck
+            messages.SendPaidReaction
+            messages.GetPaidReactionPrivacy
+            channels.CreateChannel
+            channels.EditAdmin
+            channels.EditTitle
+            channels.EditPhoto
+            channels.JoinChannel
+            channels.LeaveChannel
+            channels.DeleteChannel
+            channels.ToggleSignatures
+            channels.EditBanned
+            channels.DeleteHistory
+            channels.TogglePreHistoryHidden
+            channels.EditCreator
+            channels.ToggleSlowMode
+            channels.ConvertToGigagroup
+            channels.ToggleJoinToSend
+            channels.ToggleJoinRequest
+            channels.ToggleForum
+            channels.CreateForumTopic
+            channels.EditForumTopic
+            channels.UpdatePinnedForumTopic
+            channels.ReorderPinnedForumTopics
+            channels.ToggleAntiSpam
+            channels.ToggleParticipantsHidden
+            channels.UpdateColor
+            channels.ToggleViewForumAsMessages
+            channels.UpdateEmojiStatus
+            channels.SetBoostsToUnblockRestrictions
+            channels.RestrictSponsoredMessages
+            bots.AllowSendMessage
+            payments.AssignAppStoreTransaction
+            payments.AssignPlayMarketTransaction
+            payments.ApplyGiftCode
+            payments.LaunchPrepaidGiveaway
+            payments.RefundStarsCharge
+            payments.UpgradeStarGift
+            payments.TransferStarGift
+            phone.DiscardCall
+            phone.SetCallRating
+            phone.CreateGroupCall
+            phone.JoinGroupCall
+            phone.LeaveGroupCall
+            phone.InviteToGroupCall
+            phone.DiscardGroupCall
+            phone.ToggleGroupCallSettings
+            phone.ToggleGroupCallRecord
+            phone.EditGroupCallParticipant
+            phone.EditGroupCallTitle
+            phone.ToggleGroupCallStartSubscription
+            phone.StartScheduledGroupCall
+            phone.JoinGroupCallPresentation
+            phone.LeaveGroupCallPresentation
+            folders.EditPeerFolders
+            chatlists.JoinChatlistInvite
+            chatlists.JoinChatlistUpdates
+            chatlists.LeaveChatlist
+            stories.SendStory
+            stories.EditStory
+            stories.ActivateStealthMode
+            stories.SendReaction
+            stories.GetAllReadPeerStories
+    """
+
+    __slots__: List[str] = ["update", "date"]
+
+    ID = 0x78d4dec1
+    QUALNAME = "types.UpdateShort"
+
+    def __init__(self, *, update: "raw.base.Update", date: int) -> None:
+        self.update = update  # Update
+        self.date = date  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateShort":
+        # No flags
+        
+        update = TLObject.read(b)
+        
+        date = Int.read(b)
+        
+        return UpdateShort(update=update, date=date)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.update.write())
+        
+        b.write(Int(self.date))
+        
+        return b.getvalue()
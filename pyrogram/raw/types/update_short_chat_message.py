@@ -0,0 +1,309 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateShortChatMessage(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.Updates`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``4D6DEEA5``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        from_id (``int`` ``64-bit``):
+            N/A
+
+        chat_id (``int`` ``64-bit``):
+            N/A
+
+        message (``str``):
+            N/A
+
+        pts (``int`` ``32-bit``):
+            N/A
+
+        pts_count (``int`` ``32-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        out (``bool``, *optional*):
+            N/A
+
+        mentioned (``bool``, *optional*):
+            N/A
+
+        media_unread (``bool``, *optional*):
+            N/A
+
+        silent (``bool``, *optional*):
+            N/A
+
+        fwd_from (:obj:`MessageFwdHeader <pyrogram.raw.base.MessageFwdHeader>`, *optional*):
+            N/A
+
+        via_bot_id (``int`` ``64-bit``, *optional*):
+            N/A
+
+        reply_to (:obj:`MessageReplyHeader <pyrogram.raw.base.MessageReplyHeader>`, *optional*):
+            N/A
+
+        entities (List of :obj:`MessageEntity <pyrogram.raw.base.MessageEntity>`, *optional*):
+            N/A
+
+        ttl_period (``int`` ``32-bit``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 107 functions.
+
+        .. currentmodule:: pyrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.GetNotifyExceptions
+            account.UpdateConnectedBot
+            account.GetBotBusinessConnection
+            contacts.DeleteContacts
+            contacts.AddContact
+            contacts.AcceptContact
+            contacts.GetLocated
+            contacts.BlockFromReplies
+            messages.SendMessage
+            messages.SendMedia
+            messages.ForwardMessages
+            messages.EditChatTitle
+            messages.EditChatPhoto
+            messages.DeleteChatUser
+            messages.ImportChatInvite
+            messages.StartBot
+            messages.MigrateChat
+            messages.SendInlineBotResult
+            messages.EditMessage
+            messages.GetAllDrafts
+            messages.SetGameScore
+            messages.SendScreenshotNotification
+            messages.SendMultiMedia
+            messages.UpdatePinnedMessage
+            messages.SendVote
+            messages.GetPollResults
+            messages.EditChatDefaultBannedRights
+            messages.SendScheduledMessages
+            messages.DeleteScheduledMessages
+            messages.SetHistoryTTL
+            messages.SetChatTheme
+            messages.HideChatJoinRequest
+            messages.HideAllChatJoinRequests
+            messages.ToggleNoForwards
+            messages.SendReaction
+            messages.GetMessagesReactions
+            messages.SetChatAvailableReactions
+            messages.SendWebViewData
+            messages.GetExtendedMedia
+            messages.SendBotRequestedPeer
+            messages.SetChatWallPaper
+            messages.SendQuickReplyMessages
+            messages.DeleteQuickReplyMessages
+            messages.EditFactCheck
+            messages.DeleteFactCheck
+            messages.SendPaidReaction
+            messages.GetPaidReactionPrivacy
+            channels.CreateChannel
+            channels.EditAdmin
+            channels.EditTitle
+            channels.EditPhoto
+            channels.JoinChannel
+            channels.LeaveChannel
+            channels.DeleteChannel
+            channels.ToggleSignatures
+            channels.EditBanned
+            channels.DeleteHistory
+            channels.TogglePreHistoryHidden
+            channels.EditCreator
+            channels.ToggleSlowMode
+            channels.ConvertToGigagroup
+            channels.ToggleJoinToSend
+            channels.ToggleJoinRequest
+            channels.ToggleForum
+            channels.CreateForumTopic
+            channels.EditForumTopic
+            channels.UpdatePinnedForumTopic
+            channels.ReorderPinnedForumTopics
+            channels.ToggleAntiSpam
+            channels.ToggleParticipantsHidden
+            channels.UpdateColor
+            channels.ToggleViewForumAsMessages
+            channels.UpdateEmojiStatus
+            channels.SetBoostsToUnblockRestrictions
+            channels.RestrictSponsoredMessages
+            bots.AllowSendMessage
+            payments.AssignAppStoreTransaction
+            payments.AssignPlayMarketTransaction
+            payments.ApplyGiftCode
+            payments.LaunchPrepaidGiveaway
+            payments.RefundStarsCharge
+            payments.UpgradeStarGift
+            payments.TransferStarGift
+            phone.DiscardCall
+            phone.SetCallRating
+            phone.CreateGroupCall
+            phone.JoinGroupCall
+            phone.LeaveGroupCall
+            phone.InviteToGroupCall
+            phone.DiscardGroupCall
+            phone.ToggleGroupCallSettings
+            phone.ToggleGroupCallRecord
+            phone.EditGroupCallParticipant
+            phone.EditGroupCallTitle
+            phone.ToggleGroupCallStartSubscription
+            phone.StartScheduledGroupCall
+            phone.JoinGroupCallPresentation
+            phone.LeaveGroupCallPresentation
+            folders.EditPeerFolders
+            chatlists.JoinChatlistInvite
+            chatlists.JoinChatlistUpdates
+            chatlists.LeaveChatlist
+            stories.SendStory
+            stories.EditStory
+            stories.ActivateStealthMode
+            stories.SendReaction
+            stories.GetAllReadPeerStories
+    """
+
+    __slots__: List[str] = ["id", "from_id", "chat_id", "message", "pts", "pts_count", "date", "out", "mentioned", "media_unread", "silent", "fwd_from", "via_bot_id", "reply_to", "entities", "ttl_period"]
+
+    ID = 0x4d6deea5
+    QUALNAME = "types.UpdateShortChatMessage"
+
+    def __init__(self, *, id: int, from_id: int, chat_id: int, message: str, pts: int, pts_count: int, date: int, out: Optional[bool] = None, mentioned: Optional[bool] = None, media_unread: Optional[bool] = None, silent: Optional[bool] = None, fwd_from: "raw.base.MessageFwdHeader" = None, via_bot_id: Optional[int] = None, reply_to: "raw.base.MessageReplyHeader" = None, entities: Optional[List["raw.base.MessageEntity"]] = None, ttl_period: Optional[int] = None) -> None:
+        self.id = id  # int
+        self.from_id = from_id  # long
+        self.chat_id = chat_id  # long
+        self.message = message  # string
+        self.pts = pts  # int
+        self.pts_count = pts_count  # int
+        self.date = date  # int
+        self.out = out  # flags.1?true
+        self.mentioned = mentioned  # flags.4?true
+        self.media_unread = media_unread  # flags.5?true
+        self.silent = silent  # flags.13?true
+        self.fwd_from = fwd_from  # flags.2?MessageFwdHeader
+        self.via_bot_id = via_bot_id  # flags.11?long
+        self.reply_to = reply_to  # flags.3?MessageReplyHeader
+        self.entities = entities  # flags.7?Vector<MessageEntity>
+        self.ttl_period = ttl_period  # flags.25?int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateShortChatMessage":
+        
+        flags = Int.read(b)
+        
+        out = True if flags & (1 << 1) else False
+        mentioned = True if flags & (1 << 4) else False
+        media_unread = True if flags & (1 << 5) else False
+        silent = True if flags & (1 << 13) else False
+        id = Int.read(b)
+        
+        from_id = Long.read(b)
+        
+        chat_id = Long.read(b)
+        
+        message = String.read(b)
+        
+        pts = Int.read(b)
+        
+        pts_count = Int.read(b)
+        
+        date = Int.read(b)
+        
+        fwd_from = TLObject.read(b) if flags & (1 << 2) else None
+        
+        via_bot_id = Long.read(b) if flags & (1 << 11) else None
+        reply_to = TLObject.read(b) if flags & (1 << 3) else None
+        
+        entities = TLObject.read(b) if flags & (1 << 7) else []
+        
+        ttl_period = Int.read(b) if flags & (1 << 25) else None
+        return UpdateShortChatMessage(id=id, from_id=from_id, chat_id=chat_id, message=message, pts=pts, pts_count=pts_count, date=date, out=out, mentioned=mentioned, media_unread=media_unread, silent=silent, fwd_from=fwd_from, via_bot_id=via_bot_id, reply_to=reply_to, entities=entities, ttl_period=ttl_period)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 1) if self.out else 0
+        flags |= (1 << 4) if self.mentioned else 0
+        flags |= (1 << 5) if self.media_unread else 0
+        flags |= (1 << 13) if self.silent else 0
+        flags |= (1 << 2) if self.fwd_from is not None else 0
+        flags |= (1 << 11) if self.via_bot_id is not None else 0
+        flags |= (1 << 3) if self.reply_to is not None else 0
+        flags |= (1 << 7) if self.entities else 0
+        flags |= (1 << 25) if self.ttl_period is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.id))
+        
+        b.write(Long(self.from_id))
+        
+        b.write(Long(self.chat_id))
+        
+        b.write(String(self.message))
+        
+        b.write(Int(self.pts))
+        
+        b.write(Int(self.pts_count))
+        
+        b.write(Int(self.date))
+        
+        if self.fwd_from is not None:
+            b.write(self.fwd_from.write())
+        
+        if self.via_bot_id is not None:
+            b.write(Long(self.via_bot_id))
+        
+        if self.reply_to is not None:
+            b.write(self.reply_to.write())
+        
+        if self.entities is not None:
+            b.write(Vector(self.entities))
+        
+        if self.ttl_period is not None:
+            b.write(Int(self.ttl_period))
+        
+        return b.getvalue()
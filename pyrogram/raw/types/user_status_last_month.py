@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UserStatusLastMonth(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.UserStatus`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``65899777``
+
+    Parameters:
+        by_me (``bool``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["by_me"]
+
+    ID = 0x65899777
+    QUALNAME = "types.UserStatusLastMonth"
+
+    def __init__(self, *, by_me: Optional[bool] = None) -> None:
+        self.by_me = by_me  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UserStatusLastMonth":
+        
+        flags = Int.read(b)
+        
+        by_me = True if flags & (1 << 0) else False
+        return UserStatusLastMonth(by_me=by_me)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.by_me else 0
+        b.write(Int(flags))
+        
+        return b.getvalue()
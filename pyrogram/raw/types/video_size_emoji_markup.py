@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class VideoSizeEmojiMarkup(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.VideoSize`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``F85C413C``
+
+    Parameters:
+        emoji_id (``int`` ``64-bit``):
+            N/A
+
+        background_colors (List of ``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["emoji_id", "background_colors"]
+
+    ID = 0xf85c413c
+    QUALNAME = "types.VideoSizeEmojiMarkup"
+
+    def __init__(self, *, emoji_id: int, background_colors: List[int]) -> None:
+        self.emoji_id = emoji_id  # long
+        self.background_colors = background_colors  # Vector<int>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "VideoSizeEmojiMarkup":
+        # No flags
+        
+        emoji_id = Long.read(b)
+        
+        background_colors = TLObject.read(b, Int)
+        
+        return VideoSizeEmojiMarkup(emoji_id=emoji_id, background_colors=background_colors)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.emoji_id))
+        
+        b.write(Vector(self.background_colors, Int))
+        
+        return b.getvalue()
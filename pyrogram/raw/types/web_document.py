@@ -0,0 +1,104 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class WebDocument(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.WebDocument`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``1C570ED1``
+
+    Parameters:
+        url (``str``):
+            N/A
+
+        access_hash (``int`` ``64-bit``):
+            N/A
+
+        size (``int`` ``32-bit``):
+            N/A
+
+        mime_type (``str``):
+            N/A
+
+        attributes (List of :obj:`DocumentAttribute <pyrogram.raw.base.DocumentAttribute>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["url", "access_hash", "size", "mime_type", "attributes"]
+
+    ID = 0x1c570ed1
+    QUALNAME = "types.WebDocument"
+
+    def __init__(self, *, url: str, access_hash: int, size: int, mime_type: str, attributes: List["raw.base.DocumentAttribute"]) -> None:
+        self.url = url  # string
+        self.access_hash = access_hash  # long
+        self.size = size  # int
+        self.mime_type = mime_type  # string
+        self.attributes = attributes  # Vector<DocumentAttribute>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "WebDocument":
+        # No flags
+        
+        url = String.read(b)
+        
+        access_hash = Long.read(b)
+        
+        size = Int.read(b)
+        
+        mime_type = String.read(b)
+        
+        attributes = TLObject.read(b)
+        
+        return WebDocument(url=url, access_hash=access_hash, size=size, mime_type=mime_type, attributes=attributes)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(Long(self.access_hash))
+        
+        b.write(Int(self.size))
+        
+        b.write(String(self.mime_type))
+        
+        b.write(Vector(self.attributes))
+        
+        return b.getvalue()
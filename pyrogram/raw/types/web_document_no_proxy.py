@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from pyrogram.raw.core import TLObject
+from pyrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class WebDocumentNoProxy(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~pyrogram.raw.base.WebDocument`.
+
+    Details:
+        - Layer: ``199``
+        - ID: ``F9C8BCC6``
+
+    Parameters:
+        url (``str``):
+            N/A
+
+        size (``int`` ``32-bit``):
+            N/A
+
+        mime_type (``str``):
+            N/A
+
+        attributes (List of :obj:`DocumentAttribute <pyrogram.raw.base.DocumentAttribute>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["url", "size", "mime_type", "attributes"]
+
+    ID = 0xf9c8bcc6
+    QUALNAME = "types.WebDocumentNoProxy"
+
+    def __init__(self, *, url: str, size: int, mime_type: str, attributes: List["raw.base.DocumentAttribute"]) -> None:
+        self.url = url  # string
+        self.size = size  # int
+        self.mime_type = mime_type  # string
+        self.attributes = attributes  # Vector<DocumentAttribute>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "WebDocumentNoProxy":
+        # No flags
+        
+        url = String.read(b)
+        
+        size = Int.read(b)
+        
+        mime_type = String.read(b)
+        
+        attributes = TLObject.read(b)
+        
+        return WebDocumentNoProxy(url=url, size=size, mime_type=mime_type, attributes=attributes)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(Int(self.size))
+        
+        b.write(String(self.mime_type))
+        
+        b.write(Vector(self.attributes))
+        
+        return b.getvalue()
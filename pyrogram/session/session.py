@@ -20,6 +20,7 @@ import asyncio
 import bisect
 import logging
 import os
+from contextvars import ContextVar
 from hashlib import sha1
 from io import BytesIO
 from typing import Optional
@@ -45,6 +46,48 @@ class Result:
         self.event = asyncio.Event()
 
 
+class InvokeAfterChain:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Head of the chain for each session: the last request sent that hasn't failed
+        self.last_msg_ids = {}
+        # The msg_id each pending request was chained after
+        self.previous_msg_ids = {}
+
+    def wrap(self, session: "Session", query: TLObject) -> TLObject:
+        msg_id = self.last_msg_ids.get(session)
+
+        if msg_id is None:
+            return query
+
+        return raw.functions.InvokeAfterMsg(msg_id=msg_id, query=query)
+
+    def push(self, session: "Session", msg_id: int):
+        self.previous_msg_ids[msg_id] = self.last_msg_ids.get(session)
+        self.last_msg_ids[session] = msg_id
+
+    def done(self, session: "Session", msg_id: int, success: bool):
+        previous_msg_id = self.previous_msg_ids.pop(msg_id, None)
+
+        if success:
+            return
+
+        # Requests already chained after a failed one will fail with MSG_WAIT_FAILED, but the ones sent
+        # from now on are chained after the last request that didn't fail
+        for pending_msg_id, chained_after in self.previous_msg_ids.items():
+            if chained_after == msg_id:
+                self.previous_msg_ids[pending_msg_id] = previous_msg_id
+
+        if self.last_msg_ids.get(session) == msg_id:
+            if previous_msg_id is None:
+                del self.last_msg_ids[session]
+            else:
+                self.last_msg_ids[session] = previous_msg_id
+
+
+invoke_after_chain = ContextVar("invoke_after_chain", default=None)
+
+
 class Session:
     START_TIMEOUT = 2
     WAIT_TIMEOUT = 15
@@ -334,7 +377,7 @@ class Session:
 
         log.info("NetworkTask stopped")
 
-    async def send(self, data: TLObject, wait_response: bool = True, timeout: float = WAIT_TIMEOUT):
+    async def transmit(self, data: TLObject, wait_response: bool) -> int:
         message = self.msg_factory(data)
         msg_id = message.msg_id
 
@@ -359,6 +402,20 @@ class Session:
             self.results.pop(msg_id, None)
             raise e
 
+        return msg_id
+
+    async def send(self, data: TLObject, wait_response: bool = True, timeout: float = WAIT_TIMEOUT):
+        chain = invoke_after_chain.get()
+
+        if chain is not None and wait_response and not self.is_media and self.is_started.is_set():
+            # Requests are transmitted one at a time so that each one can depend on the previous msg_id
+            async with chain.lock:
+                msg_id = await self.transmit(chain.wrap(self, data), wait_response)
+                chain.push(self, msg_id)
+        else:
+            chain = None
+            msg_id = await self.transmit(data, wait_response)
+
         if wait_response:
             try:
                 await asyncio.wait_for(self.results[msg_id].event.wait(), timeout)
@@ -367,6 +424,14 @@ class Session:
 
             result = self.results.pop(msg_id).value
 
+            if chain is not None:
+                chain.done(
+                    self, msg_id,
+                    result is not None and not isinstance(
+                        result, (raw.types.RpcError, raw.types.BadMsgNotification, raw.types.BadServerSalt)
+                    )
+                )
+
             if result is None:
                 raise TimeoutError("Request timed out")
 
@@ -381,7 +446,14 @@ class Session:
 
             if isinstance(result, raw.types.BadServerSalt):
                 self.salt = result.new_server_salt
-                return await self.send(data, wait_response, timeout)
+
+                # The re-sent request is not chained, the msg_id the original one depended on may have been rejected
+                token = invoke_after_chain.set(None)
+
+                try:
+                    return await self.send(data, wait_response, timeout)
+                finally:
+                    invoke_after_chain.reset(token)
 
             return result
 
@@ -403,30 +475,44 @@ class Session:
             inner_query = query
 
         query_name = ".".join(inner_query.QUALNAME.split(".")[1:])
+        token = None
 
-        while True:
-            try:
-                return await self.send(query, timeout=timeout)
-            except (FloodWait, FloodPremiumWait) as e:
-                amount = e.value
-
-                if amount > sleep_threshold >= 0:
-                    raise
-
-                log.warning('[%s] Waiting for %s seconds before continuing (required by "%s")',
-                            self.client.name, amount, query_name)
+        try:
+            while True:
+                try:
+                    return await self.send(query, timeout=timeout)
+                except (FloodWait, FloodPremiumWait) as e:
+                    amount = e.value
+
+                    if amount > sleep_threshold >= 0:
+                        raise
+
+                    log.warning('[%s] Waiting for %s seconds before continuing (required by "%s")',
+                                self.client.name, amount, query_name)
+
+                    await asyncio.sleep(amount)
+                except (OSError, InternalServerError, ServiceUnavailable) as e:
+                    # Requests chained after a failed one aren't retried, their order couldn't be kept anymore
+                    if retries == 0 or isinstance(e, RPCError) and e.ID == "MSG_WAIT_FAILED":
+                        raise e from None
+
+                    (log.warning if retries < 2 else log.info)(
+                        '[%s] Retrying "%s" due to: %s',
+                        Session.MAX_RETRIES - retries + 1,
+                        query_name, str(e) or repr(e)
+                    )
 
-                await asyncio.sleep(amount)
-            except (OSError, InternalServerError, ServiceUnavailable) as e:
-                if retries == 0:
-                    raise e from None
+                    await asyncio.sleep(0.5)
 
-                (log.warning if retries < 2 else log.info)(
-                    '[%s] Retrying "%s" due to: %s',
-                    Session.MAX_RETRIES - retries + 1,
-                    query_name, str(e) or repr(e)
-                )
+                    # Retries are sent outside of any pipeline, they would be chained after unrelated requests
+                    if token is None:
+                        token = invoke_after_chain.set(None)
 
-                await asyncio.sleep(0.5)
+                    return await self.invoke(query, retries - 1, timeout)
 
-                return await self.invoke(query, retries - 1, timeout)
+                # Requests sent again after a flood wait aren't chained either
+                if token is None:
+                    token = invoke_after_chain.set(None)
+        finally:
+            if token is not None:
+                invoke_after_chain.reset(token)
@@ -16,10 +16,12 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
+import asyncio
 import logging
 from datetime import datetime
-from functools import partial
-from typing import List, Match, Union, BinaryIO, Optional, Callable
+from typing import List, Match, Union, BinaryIO, Optional, Callable, Tuple
 
 import pyrogram
 from pyrogram import raw, enums
@@ -1405,6 +1407,22 @@ class Message(Object, Update):
     def content(self) -> str:
         return self.text or self.caption or Str("").init([])
 
+    def _resolve_reply_defaults(
+        self,
+        quote: bool,
+        reply_to_message_id: int,
+        message_thread_id: int,
+        business_connection_id: str
+    ) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+        if reply_to_message_id is None and (self.chat.type != enums.ChatType.PRIVATE if quote is None else quote):
+            reply_to_message_id = self.id
+
+        return (
+            reply_to_message_id,
+            self.message_thread_id if message_thread_id is None else message_thread_id,
+            self.business_connection_id if business_connection_id is None else business_connection_id
+        )
+
     async def get_media_group(self) -> List["types.Message"]:
         """Bound method *get_media_group* of :obj:`~pyrogram.types.Message`.
 
@@ -1541,17 +1559,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_message(
             chat_id=self.chat.id,
@@ -1728,17 +1738,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_animation(
             chat_id=self.chat.id,
@@ -1910,17 +1912,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_audio(
             chat_id=self.chat.id,
@@ -2038,17 +2032,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_cached_media(
             chat_id=self.chat.id,
@@ -2216,17 +2202,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_contact(
             chat_id=self.chat.id,
@@ -2402,17 +2380,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_document(
             chat_id=self.chat.id,
@@ -2510,14 +2480,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
+        reply_to_message_id, message_thread_id, _ = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, None
+        )
 
         return await self._client.send_game(
             chat_id=self.chat.id,
@@ -2598,14 +2563,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
+        reply_to_message_id, message_thread_id, _ = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, None
+        )
 
         return await self._client.send_inline_bot_result(
             chat_id=self.chat.id,
@@ -2708,17 +2668,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_location(
             chat_id=self.chat.id,
@@ -2817,17 +2769,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_media_group(
             chat_id=self.chat.id,
@@ -2988,17 +2932,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_photo(
             chat_id=self.chat.id,
@@ -3194,17 +3130,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_poll(
             chat_id=self.chat.id,
@@ -3368,17 +3296,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_sticker(
             chat_id=self.chat.id,
@@ -3513,17 +3433,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_venue(
             chat_id=self.chat.id,
@@ -3725,17 +3637,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_video(
             chat_id=self.chat.id,
@@ -3909,17 +3813,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_video_note(
             chat_id=self.chat.id,
@@ -4078,17 +3974,9 @@ class Message(Object, Update):
         Raises:
             RPCError: In case of a Telegram RPC error.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_voice(
             chat_id=self.chat.id,
@@ -4235,17 +4123,9 @@ class Message(Object, Update):
         Returns:
             :obj:`~pyrogram.types.Message`: On success, the sent message is returned.
         """
-        if quote is None:
-            quote = self.chat.type != enums.ChatType.PRIVATE
-
-        if reply_to_message_id is None and quote:
-            reply_to_message_id = self.id
-
-        if message_thread_id is None:
-            message_thread_id = self.message_thread_id
-
-        if business_connection_id is None:
-            business_connection_id = self.business_connection_id
+        reply_to_message_id, message_thread_id, business_connection_id = self._resolve_reply_defaults(
+            quote, reply_to_message_id, message_thread_id, business_connection_id
+        )
 
         return await self._client.send_web_page(
             chat_id=self.chat.id,
@@ -4686,40 +4566,15 @@ class Message(Object, Update):
                 reply_markup=self.reply_markup if reply_markup is object else reply_markup
             )
         elif self.media:
-            send_media = partial(
-                self._client.send_cached_media,
-                chat_id=chat_id,
-                disable_notification=disable_notification,
-                message_thread_id=message_thread_id,
-                reply_to_message_id=reply_to_message_id,
-                reply_to_chat_id=reply_to_chat_id,
-                quote_text=quote_text,
-                quote_entities=quote_entities,
-                schedule_date=schedule_date,
-                protect_content=protect_content,
-                has_spoiler=self.has_media_spoiler if has_spoiler is None else has_spoiler,
-                show_caption_above_media=self.show_caption_above_media if show_caption_above_media is None else show_caption_above_media,
-                business_connection_id=business_connection_id,
-                allow_paid_broadcast=allow_paid_broadcast,
-                reply_markup=self.reply_markup if reply_markup is object else reply_markup
-            )
+            # The media type value is the name of the attribute holding the media, which can still be None
+            # (e.g.: an expired self-destructing photo)
+            if self.media.value in {"photo", "audio", "document", "video", "animation", "voice", "sticker", "video_note"}:
+                media = getattr(self, self.media.value)
+            else:
+                media = None
 
-            if self.photo:
-                file_id = self.photo.file_id
-            elif self.audio:
-                file_id = self.audio.file_id
-            elif self.document:
-                file_id = self.document.file_id
-            elif self.video:
-                file_id = self.video.file_id
-            elif self.animation:
-                file_id = self.animation.file_id
-            elif self.voice:
-                file_id = self.voice.file_id
-            elif self.sticker:
-                file_id = self.sticker.file_id
-            elif self.video_note:
-                file_id = self.video_note.file_id
+            if media is not None:
+                file_id = media.file_id
             elif self.contact:
                 return await self._client.send_contact(
                     chat_id,
@@ -4782,22 +4637,31 @@ class Message(Object, Update):
                 raise ValueError("Unknown media type")
 
             if self.sticker or self.video_note:  # Sticker and VideoNote should have no caption
-                return await send_media(
-                    file_id=file_id,
-                    message_thread_id=message_thread_id
-                )
-            else:
-                if caption is None:
-                    caption = self.caption or ""
-                    caption_entities = self.caption_entities
-
-                return await send_media(
-                    file_id=file_id,
-                    caption=caption,
-                    parse_mode=parse_mode,
-                    caption_entities=caption_entities,
-                    message_thread_id=message_thread_id
-                )
+                caption, parse_mode, caption_entities = "", None, None
+            elif caption is None:
+                caption = self.caption or ""
+                caption_entities = self.caption_entities
+
+            return await self._client.send_cached_media(
+                chat_id=chat_id,
+                file_id=file_id,
+                caption=caption,
+                parse_mode=parse_mode,
+                caption_entities=caption_entities,
+                disable_notification=disable_notification,
+                message_thread_id=message_thread_id,
+                reply_to_message_id=reply_to_message_id,
+                reply_to_chat_id=reply_to_chat_id,
+                quote_text=quote_text,
+                quote_entities=quote_entities,
+                schedule_date=schedule_date,
+                protect_content=protect_content,
+                has_spoiler=self.has_media_spoiler if has_spoiler is None else has_spoiler,
+                show_caption_above_media=self.show_caption_above_media if show_caption_above_media is None else show_caption_above_media,
+                business_connection_id=business_connection_id,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_markup=self.reply_markup if reply_markup is object else reply_markup
+            )
         else:
             raise ValueError("Can't copy this message")
 
@@ -4944,6 +4808,59 @@ class Message(Object, Update):
             revoke=revoke
         )
 
+    @staticmethod
+    async def delete_many(messages: List["types.Message"], revoke: bool = True) -> int:
+        """Delete many messages at once, with one request for every 100 messages of the same chat.
+
+        Use as a shortcut for calling :meth:`~pyrogram.Client.delete_messages` for each chat the messages belong
+        to, instead of calling :meth:`~pyrogram.types.Message.delete` on each message.
+
+        Example:
+            .. code-block:: python
+
+                await Message.delete_many(messages)
+
+        Parameters:
+            messages (List of :obj:`~pyrogram.types.Message`):
+                The messages to delete. They can belong to different chats.
+
+            revoke (``bool``, *optional*):
+                Deletes messages on both parts.
+                This is only for private cloud chats and normal groups, messages on
+                channels and supergroups are always revoked (i.e.: deleted for everyone).
+                Defaults to True.
+
+        Returns:
+            ``int``: Amount of affected messages.
+
+        Raises:
+            RPCError: In case of a Telegram RPC error.
+        """
+        groups = {}
+
+        for message in messages:
+            groups.setdefault((message._client, message.chat.id), []).append(message.id)
+
+        async def delete_chat_messages(client: "pyrogram.Client", chat_id: int, message_ids: List[int]) -> int:
+            count = 0
+
+            # Telegram deletes at most 100 messages per request, batches of the same chat are sent one at a time
+            for i in range(0, len(message_ids), 100):
+                count += await client.delete_messages(
+                    chat_id=chat_id,
+                    message_ids=message_ids[i:i + 100],
+                    revoke=revoke
+                )
+
+            return count
+
+        r = await asyncio.gather(*[
+            delete_chat_messages(client, chat_id, message_ids)
+            for (client, chat_id), message_ids in groups.items()
+        ])
+
+        return sum(r)
+
     async def click(
         self,
         x: Union[int, str] = 0,
@@ -5037,30 +4954,24 @@ class Message(Object, Update):
             raise ValueError("The message doesn't contain any keyboard")
 
         if isinstance(x, int) and y is None:
-            try:
-                button = [
-                    button
-                    for row in keyboard
-                    for button in row
-                ][x]
-            except IndexError:
+            buttons = [button for row in keyboard for button in row]
+
+            if not -len(buttons) <= x < len(buttons):
                 raise ValueError(f"The button at index {x} doesn't exist")
+
+            button = buttons[x]
         elif isinstance(x, int) and isinstance(y, int):
-            try:
-                button = keyboard[y][x]
-            except IndexError:
+            if not (-len(keyboard) <= y < len(keyboard) and -len(keyboard[y]) <= x < len(keyboard[y])):
                 raise ValueError(f"The button at position ({x}, {y}) doesn't exist")
+
+            button = keyboard[y][x]
         elif isinstance(x, str) and y is None:
-            label = x.encode("utf-16", "surrogatepass").decode("utf-16")
-
-            try:
-                button = [
-                    button
-                    for row in keyboard
-                    for button in row
-                    if label == button.text
-                ][0]
-            except IndexError:
+            # Only labels with surrogate pairs need normalizing, which an ASCII label can't contain
+            label = x if x.isascii() else x.encode("utf-16", "surrogatepass").decode("utf-16")
+
+            button = next((button for row in keyboard for button in row if button.text == label), None)
+
+            if button is None:
                 raise ValueError(f"The button with label '{x}' doesn't exists")
         else:
             raise ValueError("Invalid arguments")
@@ -5105,10 +5016,15 @@ class Message(Object, Update):
                         "This button requires a bot as the sender"
                     )
 
+                peer, bot = await asyncio.gather(
+                    self._client.resolve_peer(self.chat.id),
+                    self._client.resolve_peer(bot_peer_id)
+                )
+
                 r = await self._client.invoke(
                     raw.functions.messages.RequestWebView(
-                        peer=await self._client.resolve_peer(self.chat.id),
-                        bot=await self._client.resolve_peer(bot_peer_id),
+                        peer=peer,
+                        bot=bot,
                         url=web_app.url,
                         platform=self._client.client_platform.value,
                         # TODO
@@ -0,0 +1,122 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw, types, utils
+from pyrogram.methods.messages.copy_media_group import CopyMediaGroup
+
+
+class Parser:
+    def __init__(self, count: int):
+        self.count = count
+        self.started = 0
+        self.all_started = asyncio.Event()
+
+    async def parse(self, text):
+        self.started += 1
+
+        if self.started == self.count:
+            self.all_started.set()
+
+        # Every caption is being parsed at the same time, otherwise this would time out
+        await asyncio.wait_for(self.all_started.wait(), 1)
+        # Finish in reverse order, the results must still follow the media group order
+        await asyncio.sleep(0.01 * (self.count - self.started))
+
+        return {"message": text, "entities": None}
+
+
+class Client(CopyMediaGroup):
+    def __init__(self, media_group):
+        self.media_group = media_group
+        self.parser = Parser(len(media_group))
+        self.sent = None
+
+    async def get_media_group(self, chat_id, message_id):
+        return self.media_group
+
+    def rnd_id(self):
+        return 0
+
+    async def resolve_peer(self, peer_id):
+        return raw.types.InputPeerSelf()
+
+    async def invoke(self, query, **kwargs):
+        self.sent = query
+        return raw.types.Updates(updates=[], users=[], chats=[], date=0, seq=0)
+
+
+def photo(caption, has_media_spoiler):
+    return types.Message(
+        id=0,
+        photo=types.Photo(file_id="file_id", file_unique_id="", width=1, height=1, file_size=1, date=None),
+        caption=caption,
+        has_media_spoiler=has_media_spoiler
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_utils(monkeypatch):
+    async def parse_text_entities(client, text, parse_mode, entities):
+        return {"message": text, "entities": entities}
+
+    async def parse_messages(client, messages):
+        return []
+
+    monkeypatch.setattr(utils, "parse_text_entities", parse_text_entities)
+    monkeypatch.setattr(utils, "parse_messages", parse_messages)
+    monkeypatch.setattr(utils, "get_input_media_from_file_id", lambda file_id, has_spoiler=None: has_spoiler)
+
+
+async def copy(captions, has_spoilers):
+    client = Client([photo("c1", True), photo(None, False), photo("None", None)])
+    await client.copy_media_group("me", "me", 0, captions=captions, has_spoilers=has_spoilers)
+
+    return [media.message for media in client.sent.multi_media], [media.media for media in client.sent.multi_media]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("captions, expected", [
+    (None, ["c1", "", ""]),
+    ("single", ["single", "", ""]),
+    ("", ["", "", ""]),
+    (["a", "b", "c"], ["a", "b", "c"]),
+    (["a"], ["a", "", ""]),
+    (["", None, "c"], ["c1", "", "c"]),
+    (["a", "b", "c", "d"], ["a", "b", "c"]),
+    ([], ["c1", "", ""])
+])
+async def test_captions(captions, expected):
+    assert (await copy(captions, None))[0] == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_spoilers, expected", [
+    (None, [True, False, None]),
+    (True, [True, True, True]),
+    (False, [False, False, False]),
+    ([False, True, False], [False, True, False]),
+    ([False], [False, False, None]),
+    ([True, True, True, True], [True, True, True]),
+    ([None, True], [None, True, None])
+])
+async def test_spoilers(has_spoilers, expected):
+    assert (await copy(None, has_spoilers))[1] == expected
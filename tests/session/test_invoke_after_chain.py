@@ -0,0 +1,176 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.errors import RPCError, BadRequest
+from pyrogram.session.session import Session, Result, InvokeAfterChain, invoke_after_chain
+
+
+class Client:
+    name = "test"
+
+
+class FakeSession(Session):
+    """Session whose requests are recorded instead of being transmitted, responses are set by the tests."""
+
+    def __init__(self, responses: list = None):
+        super().__init__(Client(), 2, bytes(256), False)
+        self.is_started.set()
+        self.sent = []
+        self.responses = responses
+
+    async def transmit(self, data, wait_response):
+        self.sent.append(data)
+        msg_id = len(self.sent)
+        self.results[msg_id] = Result()
+
+        if self.responses:
+            self.respond(msg_id, self.responses.pop(0))
+
+        return msg_id
+
+    def respond(self, msg_id, value):
+        self.results[msg_id].value = value
+        self.results[msg_id].event.set()
+
+    async def wait_sent(self, count):
+        while len(self.sent) < count:
+            await asyncio.sleep(0)
+
+
+def ping(ping_id):
+    return raw.functions.Ping(ping_id=ping_id)
+
+
+def pong(ping_id):
+    return raw.types.Pong(msg_id=0, ping_id=ping_id)
+
+
+def rpc_error(code, message):
+    return raw.types.RpcError(error_code=code, error_message=message)
+
+
+def chained_after(data):
+    return data.msg_id if isinstance(data, raw.functions.InvokeAfterMsg) else None
+
+
+@pytest.fixture
+def chain():
+    chain = InvokeAfterChain()
+    token = invoke_after_chain.set(chain)
+    yield chain
+    invoke_after_chain.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_wrap():
+    session = FakeSession()
+    chain = InvokeAfterChain()
+    query = ping(1)
+
+    assert chain.wrap(session, query) is query
+
+    chain.push(session, 10)
+    wrapped = chain.wrap(session, query)
+
+    assert isinstance(wrapped, raw.functions.InvokeAfterMsg)
+    assert wrapped.msg_id == 10
+    assert wrapped.query is query
+
+
+@pytest.mark.asyncio
+async def test_requests_are_chained(chain):
+    session = FakeSession([pong(1), pong(2), pong(3)])
+
+    for i in range(1, 4):
+        assert (await session.send(ping(i))).ping_id == i
+
+    assert [chained_after(data) for data in session.sent] == [None, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_leaves_chain(chain):
+    session = FakeSession()
+
+    first = asyncio.ensure_future(session.send(ping(1)))
+    await session.wait_sent(1)
+    second = asyncio.ensure_future(session.send(ping(2)))
+    await session.wait_sent(2)
+    third = asyncio.ensure_future(session.send(ping(3)))
+    await session.wait_sent(3)
+
+    session.respond(1, pong(1))
+    session.respond(2, rpc_error(400, "MESSAGE_NOT_MODIFIED"))
+    session.respond(3, rpc_error(400, "MSG_WAIT_FAILED"))
+
+    assert (await first).ping_id == 1
+
+    with pytest.raises(BadRequest):
+        await second
+
+    with pytest.raises(RPCError) as e:
+        await third
+
+    assert e.value.ID == "MSG_WAIT_FAILED"
+
+    session.responses = [pong(4)]
+    await session.send(ping(4))
+
+    # Both failed requests are dropped, the next one is chained after the last one that succeeded
+    assert [chained_after(data) for data in session.sent] == [None, 1, 2, 1]
+    assert chain.previous_msg_ids == {}
+
+
+@pytest.mark.asyncio
+async def test_msg_wait_failed_is_not_retried(chain):
+    session = FakeSession([rpc_error(500, "MSG_WAIT_FAILED")])
+
+    with pytest.raises(RPCError) as e:
+        await session.invoke(ping(1))
+
+    assert e.value.ID == "MSG_WAIT_FAILED"
+    assert len(session.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_are_not_chained(chain):
+    session = FakeSession([pong(1), rpc_error(500, "API_CALL_ERROR"), pong(2)])
+
+    await session.invoke(ping(1))
+    assert (await session.invoke(ping(2))).ping_id == 2
+
+    assert [chained_after(data) for data in session.sent] == [None, 1, None]
+    assert invoke_after_chain.get() is chain
+
+
+@pytest.mark.asyncio
+async def test_bad_server_salt_resend_is_not_chained(chain):
+    bad_server_salt = raw.types.BadServerSalt(bad_msg_id=2, bad_msg_seqno=0, error_code=48, new_server_salt=1)
+    session = FakeSession([pong(1), bad_server_salt, pong(2), pong(3)])
+
+    await session.send(ping(1))
+    assert (await session.send(ping(2))).ping_id == 2
+    await session.send(ping(3))
+
+    # The rejected request is dropped from the chain, the next one is chained after the last accepted request
+    assert [chained_after(data) for data in session.sent] == [None, 1, None, 1]
+    assert invoke_after_chain.get() is chain
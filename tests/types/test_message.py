@@ -0,0 +1,89 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import enums, types
+
+
+class Client:
+    def __init__(self):
+        self.calls = []
+        self.in_flight = {}
+        self.max_in_flight = {}
+
+    async def delete_messages(self, chat_id, message_ids, revoke=True):
+        self.calls.append((chat_id, message_ids, revoke))
+        self.in_flight[chat_id] = self.in_flight.get(chat_id, 0) + 1
+        self.max_in_flight[chat_id] = max(self.max_in_flight.get(chat_id, 0), self.in_flight[chat_id])
+
+        await asyncio.sleep(0.01)
+
+        self.in_flight[chat_id] -= 1
+        return len(message_ids)
+
+
+def message(client, chat_id, message_id):
+    return types.Message(
+        id=message_id,
+        chat=types.Chat(id=chat_id, type=enums.ChatType.SUPERGROUP),
+        client=client
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_many_groups_by_client_and_chat():
+    a, b = Client(), Client()
+    messages = [message(a, 1, 1), message(a, 2, 2), message(a, 1, 3), message(b, 1, 4)]
+
+    assert await types.Message.delete_many(messages, revoke=False) == 4
+    assert a.calls == [(1, [1, 3], False), (2, [2], False)]
+    assert b.calls == [(1, [4], False)]
+
+
+@pytest.mark.asyncio
+async def test_delete_many_batches_by_100():
+    client = Client()
+    messages = [message(client, 1, i) for i in range(250)]
+
+    assert await types.Message.delete_many(messages) == 250
+    assert [message_ids for _, message_ids, _ in client.calls] == [
+        list(range(0, 100)),
+        list(range(100, 200)),
+        list(range(200, 250))
+    ]
+    assert all(revoke for _, _, revoke in client.calls)
+
+
+@pytest.mark.asyncio
+async def test_delete_many_empty():
+    assert await types.Message.delete_many([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_many_sends_batches_of_a_chat_one_at_a_time():
+    client = Client()
+    messages = [message(client, chat_id, i) for i in range(250) for chat_id in (1, 2)]
+
+    assert await types.Message.delete_many(messages) == 500
+    assert len(client.calls) == 6
+    assert client.max_in_flight == {1: 1, 2: 1}
+    # Different chats are deleted concurrently
+    assert [chat_id for chat_id, _, _ in client.calls] == [1, 2, 1, 2, 1, 2]